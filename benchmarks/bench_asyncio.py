@@ -0,0 +1,117 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# ASYNCIO ON THE QT EVENT LOOP
+# Runs with the menu and side boxes animating the whole time:
+# - timer latency: how late "await asyncio.sleep(0.005)" wakes up
+# - hop latency: one "await asyncio.sleep(0)" round trip
+# - concurrent I/O: many socket pairs echoing lines at once
+# Usage: python benchmarks/bench_asyncio.py [connections]
+# ///////////////////////////////////////////////////////////////
+
+import asyncio
+import socket
+import statistics
+import sys
+import time
+
+from common import Quiet, application, loadMain
+
+from PySide6.QtCore import QTimer
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+async def timerLatency(count = 200, delay = 0.005):
+    lates = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await asyncio.sleep(delay)
+        lates.append(time.perf_counter() - start - delay)
+    return lates
+
+async def hopLatency(count = 2000):
+    start = time.perf_counter()
+    for _ in range(count):
+        await asyncio.sleep(0)
+    return (time.perf_counter() - start) / count
+
+async def echo(reader, writer):
+    while line := await reader.readline():
+        writer.write(line)
+        await writer.drain()
+    writer.close()
+
+async def client(sock, rounds):
+    reader, writer = await asyncio.open_connection(sock=sock)
+    for i in range(rounds):
+        writer.write(b"ping %d\n" % i)
+        await writer.drain()
+        await reader.readline()
+    writer.close()
+
+async def concurrentIO(connections, rounds = 10):
+    servers, clients = [], []
+    for _ in range(connections):
+        a, b = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=a)
+        servers.append(asyncio.ensure_future(echo(reader, writer)))
+        clients.append(b)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(sock, rounds) for sock in clients))
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*servers)
+    return connections * rounds / elapsed
+
+def run(connections = 1000):
+    env = loadMain()
+    app = application()
+    UIFunctions, Settings = env["UIFunctions"], env["Settings"]
+    loop = env["QtEventLoop"](app)
+    asyncio.set_event_loop(loop)
+    with Quiet():
+        window = env["MainWindow"]()
+
+    # KEEP THE PANELS ANIMATING
+    def animate():
+        UIFunctions.toggleMenu(window, True)
+        UIFunctions.toggleRightBox(window, True)
+    animator = QTimer()
+    animator.timeout.connect(animate)
+    animator.start(Settings.TIME_ANIMATION + 50)
+    animate()
+
+    results = {}
+    async def main():
+        lates = await timerLatency()
+        results["timer_late_median_ms"] = statistics.median(lates) * 1000
+        results["timer_late_p99_ms"] = percentile(lates, 0.99) * 1000
+        results["hop_us"] = await hopLatency() * 1e6
+        results["echo_per_s"] = await concurrentIO(connections)
+        loop.stop()
+    loop.create_task(main())
+    loop.run_forever()
+    animator.stop()
+    window.close()
+
+    print(f"sleep(5 ms) late by: median {results['timer_late_median_ms']:.2f} ms, p99 {results['timer_late_p99_ms']:.2f} ms")
+    print(f"sleep(0) hop: {results['hop_us']:.1f} us")
+    print(f"{connections} concurrent socket pairs: {results['echo_per_s']:,.0f} round trips/s")
+    return results
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,104 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# ICONS: ONE FILE PER ICON VS ATLAS + "iconCache"
+# Loads every icon of the atlas from the resources (one PNG decode each)
+# and from the atlas (one decode), then compares the maximize/restore
+# icon swap with a new QIcon per toggle and with the cached one. Vector
+# icons ("images/svg") are rendered at 1x, 1.5x and 2x: first render,
+# next run (disk cache) and later requests (memory).
+# Usage: python build_resources.py && python benchmarks/bench_icons.py
+# ///////////////////////////////////////////////////////////////
+
+import shutil
+import tempfile
+import time
+
+from common import application, timeit
+
+SCALES = (1.0, 1.5, 2.0)
+
+def loadAll(load, names):
+    from PySide6.QtGui import QPixmapCache
+    QPixmapCache.clear()
+    start = time.perf_counter()
+    for name in names:
+        load(name).toImage()
+    return time.perf_counter() - start
+
+def renderVectors(cachePath, names):
+    from PySide6.QtCore import QSize
+    from modules import IconCache
+    cache = IconCache(cachePath=cachePath)
+    start = time.perf_counter()
+    for name in names:
+        for scale in SCALES:
+            cache.icon(name).pixmap(QSize(20, 20), scale)
+    return time.perf_counter() - start, cache
+
+def run():
+    app = application()
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QIcon, QPixmap
+    from PySide6.QtWidgets import QPushButton
+    from modules import IconCache
+    from modules.icon_cache import ICON_RESOURCE
+
+    cache = IconCache()
+    if not cache.loadAtlas():
+        raise SystemExit('No icon atlas, run "python build_resources.py" first')
+    names = sorted(cache.rects)
+
+    files = min(loadAll(lambda name: QPixmap(ICON_RESOURCE.format(name)), names) for _ in range(5))
+    atlas = min(loadAll(IconCache().pixmap, names) for _ in range(5))
+
+    # MAXIMIZE / RESTORE ICON SWAP (ICON PAINTED AT ITS BUTTON SIZE)
+    button = QPushButton()
+    def newIcon():
+        button.setIcon(QIcon(ICON_RESOURCE.format("icon_restore")))
+        button.icon().pixmap(QSize(20, 20))
+    def cachedIcon():
+        button.setIcon(cache.icon("icon_restore"))
+        button.icon().pixmap(QSize(20, 20))
+
+    # VECTOR ICONS: NO DISK CACHE YET, DISK CACHE, MEMORY
+    vectors = [name for name in names if cache.source(name)]
+    import PySide6.QtSvg
+    folder = tempfile.mkdtemp()
+    try:
+        first, _ = renderVectors(folder, vectors)
+        nextRun, vectorCache = renderVectors(folder, vectors)
+        memory = timeit(lambda: [vectorCache.icon(name).pixmap(QSize(20, 20), scale) for name in vectors for scale in SCALES], number=20)
+    finally:
+        shutil.rmtree(folder)
+
+    results = {
+        "icons": len(names),
+        "files_all_ms": files * 1000,
+        "atlas_all_ms": atlas * 1000,
+        "new_icon_us": timeit(newIcon, number=200) * 1e6,
+        "cached_icon_us": timeit(cachedIcon, number=200) * 1e6,
+        "vector_icons": len(vectors),
+        "vector_render_ms": first * 1000,
+        "vector_disk_ms": nextRun * 1000,
+        "vector_memory_ms": memory * 1000,
+    }
+    for key, value in results.items():
+        print(f"{key:<16} {value:10.1f}")
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,119 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# LOG CONSOLE THROUGHPUT
+# Worker threads log as fast as they can while the GUI event loop
+# ("app.exec") runs. Reports lines/s ingested, the longest gap between
+# 5 ms heartbeat ticks on the GUI thread and the time spent in each
+# flush. Busy Python threads delay the GUI thread by themselves (GIL
+# hand-off), so the same run with a NullHandler gives the floor for the
+# gap.
+# Usage: python benchmarks/bench_log_console.py [threads] [lines per thread]
+# ///////////////////////////////////////////////////////////////
+
+import logging
+import sys
+import threading
+import time
+
+from common import application
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QPlainTextEdit
+
+from modules.log_console import LogConsole
+
+# RUN THE WORKERS UNDER THE EVENT LOOP, RETURNS (SECONDS, HEARTBEAT GAPS)
+def drive(app, logger, threads, lines):
+    ticks = []
+    heartbeat = QTimer()
+    heartbeat.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    heartbeat.start(5)
+
+    def work():
+        for i in range(lines):
+            logger.info("line %d", i)
+
+    workers = [threading.Thread(target=work, name=f"worker-{i}") for i in range(threads)]
+    done = QTimer()
+    done.timeout.connect(lambda: any(worker.is_alive() for worker in workers) or app.quit())
+    done.start(5)
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    app.exec()
+    elapsed = time.perf_counter() - start
+    done.stop()
+
+    # LET THE LAST TICKS FLUSH
+    QTimer.singleShot(100, app.quit)
+    app.exec()
+    heartbeat.stop()
+    return elapsed, [b - a for a, b in zip(ticks, ticks[1:])] or [0]
+
+def run(threads=4, lines=100000):
+    app = application()
+    widget = QPlainTextEdit()
+    widget.resize(800, 600)
+    widget.show()
+
+    logger = logging.getLogger("bench.log_console")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    # FLOOR
+    null = logging.NullHandler()
+    logger.addHandler(null)
+    floorElapsed, floorGaps = drive(app, logger, threads, lines)
+    logger.removeHandler(null)
+
+    console = LogConsole(widget, maxLines=5000)
+    console.setFormatter(logging.Formatter("%(threadName)s %(message)s"))
+    logger.addHandler(console)
+
+    # TIME EACH GUI FLUSH
+    flushes = []
+    flushPending = console.flushPending
+    def timedFlush():
+        start = time.perf_counter()
+        flushPending()
+        flushes.append(time.perf_counter() - start)
+    console.timer.timeout.disconnect()
+    console.timer.timeout.connect(timedFlush)
+
+    elapsed, gaps = drive(app, logger, threads, lines)
+    logger.removeHandler(console)
+
+    total = threads * lines
+    flushes.sort()
+    results = {
+        "lines_per_s": total / elapsed,
+        "floor_lines_per_s": total / floorElapsed,
+        "max_gui_gap_ms": max(gaps) * 1000,
+        "floor_max_gui_gap_ms": max(floorGaps) * 1000,
+        "flushes": len(flushes),
+        "median_flush_ms": flushes[len(flushes) // 2] * 1000 if flushes else 0,
+        "max_flush_ms": max(flushes or [0]) * 1000,
+        "blocks": widget.blockCount(),
+        "last_line": widget.document().lastBlock().text(),
+    }
+    print(f"{total} lines in {elapsed:.2f} s: {results['lines_per_s']:,.0f} lines/s (NullHandler {results['floor_lines_per_s']:,.0f}), "
+          f"max GUI gap {results['max_gui_gap_ms']:.1f} ms (NullHandler {results['floor_max_gui_gap_ms']:.1f}), "
+          f"{results['flushes']} flushes (median {results['median_flush_ms']:.1f} ms, max {results['max_flush_ms']:.1f} ms), {results['blocks']} lines kept")
+    return results
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
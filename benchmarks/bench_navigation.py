@@ -0,0 +1,76 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# CLICK TO PAGE SWITCH LATENCY
+# Registry ("UIFunctions.navigate") against the old "buttonClick" flow:
+# compare names in turn, walk "topMenu" with "findChildren" and
+# re-parse every button stylesheet.
+# Usage: python benchmarks/bench_navigation.py
+# ///////////////////////////////////////////////////////////////
+
+import random
+
+from common import Quiet, loadMain, timeit
+
+from PySide6.QtWidgets import QPushButton, QWidget
+
+PAGES = (10, 100, 1000)
+
+def legacyClick(window, names, name):
+    ui = window.ui
+    UIFunctions, Settings = window.env["UIFunctions"], window.env["Settings"]
+    for btnName in names:
+        if btnName == name:
+            btn, page = window.pages[name]
+            ui.stackedWidget.setCurrentWidget(page)
+            for w in ui.topMenu.findChildren(QPushButton):
+                if w.objectName() != btnName:
+                    w.setStyleSheet(w.styleSheet().replace(Settings.MENU_SELECTED_STYLESHEET, ""))
+            btn.setStyleSheet(btn.styleSheet() + Settings.MENU_SELECTED_STYLESHEET)
+
+def run():
+    env = loadMain()
+    UIFunctions = env["UIFunctions"]
+    env["Settings"].PREBUILD_PAGES = False
+
+    results = {}
+    for count in PAGES:
+        with Quiet():
+            window = env["MainWindow"]()
+        window.env = env
+        names = []
+        for i in range(count):
+            button = QPushButton(window.ui.topMenu)
+            button.setObjectName(f"btn_page_{i}")
+            page = QWidget()
+            page.setObjectName(f"page_{i}")
+            UIFunctions.registerPage(window, button, page)
+            names.append(button.objectName())
+
+        rng = random.Random(count)
+        targets = [rng.choice(names) for _ in range(200)]
+        iterTargets = iter(targets * 1000)
+
+        registry = timeit(lambda: UIFunctions.navigate(window, next(iterTargets)), number=200)
+        legacy = timeit(lambda: legacyClick(window, names, next(iterTargets)), number=20, repeat=3)
+        results[count] = {"registry_us": registry * 1e6, "legacy_us": legacy * 1e6}
+        print(f"{count:>5} pages  registry {registry * 1e6:10.1f} us  legacy {legacy * 1e6:10.1f} us")
+        window.close()
+        window.deleteLater()
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,90 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# PANEL ANIMATION FRAME TIME: "layout" VS "snapshot" (Settings.ANIMATION_MODE)
+# Each frame moves the animation forward and processes the resulting
+# layout and paint events, like one tick of the running animation.
+# Usage: python benchmarks/bench_panels.py
+# ///////////////////////////////////////////////////////////////
+
+import statistics
+import time
+
+from common import Quiet, application, loadMain
+
+FRAMES = 30
+MODES = ("layout", "snapshot")
+
+def animation(window, mode, attribute):
+    if mode == "snapshot":
+        return window.panelTransition.animation
+    return getattr(window, attribute)
+
+def frameTimes(app, window, mode, toggle, attribute):
+    start = time.perf_counter()
+    toggle()
+    startCost = time.perf_counter() - start
+
+    running = animation(window, mode, attribute)
+    running.pause()
+    duration = running.totalDuration()
+
+    times = []
+    for frame in range(1, FRAMES + 1):
+        start = time.perf_counter()
+        running.setCurrentTime(duration * frame // FRAMES)
+        app.processEvents()
+        times.append(time.perf_counter() - start)
+    running.setCurrentTime(duration)
+    app.processEvents()
+    return startCost, times
+
+def run():
+    env = loadMain()
+    app = application()
+    UIFunctions, Settings = env["UIFunctions"], env["Settings"]
+    Settings.PREBUILD_PAGES = False
+
+    results = {}
+    for mode in MODES:
+        Settings.ANIMATION_MODE = mode
+        with Quiet():
+            window = env["MainWindow"]()
+            window.ui.btn_widgets.click()
+        app.processEvents()
+
+        # NAME: (TOGGLE, ANIMATION ATTRIBUTE IN "layout" MODE)
+        toggles = {
+            "toggleMenu": (lambda: UIFunctions.toggleMenu(window, True), "animation"),
+            "toggleLeftBox": (lambda: UIFunctions.toggleLeftBox(window, True), "group"),
+            "toggleRightBox": (lambda: UIFunctions.toggleRightBox(window, True), "group"),
+        }
+        results[mode] = {}
+        for name, (toggle, attribute) in toggles.items():
+            startCost, times = frameTimes(app, window, mode, toggle, attribute)
+            results[mode][name] = {
+                "start_ms": startCost * 1000,
+                "frame_median_ms": statistics.median(times) * 1000,
+                "frame_max_ms": max(times) * 1000,
+            }
+            print(f"{mode:<9} {name:<15} start {startCost * 1000:7.2f} ms  frame median {statistics.median(times) * 1000:7.2f} ms  max {max(times) * 1000:7.2f} ms")
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,69 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# STARTUP BENCHMARK: "resources_rc.py" VS MEMORY MAPPED "resources.rcc"
+# Each sample runs in a fresh interpreter so nothing is cached.
+# Usage: python benchmarks/bench_resources.py [runs]
+# ///////////////////////////////////////////////////////////////
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# FIRST FRAME ICONS
+FIRST_FRAME_ICONS = [
+    ":/icons/images/icons/icon_menu.png",
+    ":/icons/images/icons/cil-home.png",
+    ":/icons/images/icons/cil-gamepad.png",
+    ":/icons/images/icons/cil-file.png",
+    ":/icons/images/icons/cil-save.png",
+    ":/icons/images/icons/icon_close.png",
+]
+
+SETUP = "import time; from PySide6.QtCore import QFile, QResource; t = time.perf_counter()\n"
+
+# {METRIC: (FILE, CODE)}
+PATHS = {
+    "resources_rc_py_ms": ("resources_rc.py", "import sys; sys.path.insert(0, 'modules'); import resources_rc\n"),
+    "resources_rcc_ms": ("resources.rcc", "assert QResource.registerResource('resources.rcc')\n"),
+}
+
+READ_ICONS = (
+    "for name in %r:\n"
+    "    f = QFile(name); assert f.open(QFile.ReadOnly); f.readAll(); f.close()\n"
+    "print(time.perf_counter() - t)\n" % FIRST_FRAME_ICONS
+)
+
+def sample(code):
+    out = subprocess.check_output([sys.executable, "-c", SETUP + code + READ_ICONS], cwd=ROOT)
+    return float(out.decode().strip())
+
+def run(runs=10):
+    if not os.path.isfile(os.path.join(ROOT, "resources.rcc")):
+        sys.exit('"resources.rcc" not found, run: python build_resources.py')
+    results = {}
+    for key, (name, code) in PATHS.items():
+        sample(code) # WARM UP DISK CACHE
+        times = [sample(code) for _ in range(runs)]
+        results[key] = statistics.median(times) * 1000
+        print(f"{name:<18} median {results[key]:8.2f} ms  min {min(times) * 1000:8.2f} ms")
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
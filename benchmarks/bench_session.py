@@ -0,0 +1,91 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SESSION RESTORE
+# Reopening with the menu and the left box open on the "widgets" page:
+# "restore" applies a saved session before "show", "replay" shows the
+# default window and then clicks its way there (animations included).
+# Reports the time until the window is in that state and the layout
+# requests processed on the way.
+# Usage: python benchmarks/bench_session.py
+# ///////////////////////////////////////////////////////////////
+
+import time
+
+from common import Quiet, application, loadMain
+
+SESSION = {"menu": True, "leftBox": True, "rightBox": False, "maximized": False, "page": "btn_widgets"}
+
+def layoutRequests(app):
+    from PySide6.QtCore import QEvent, QObject
+
+    class Counter(QObject):
+        count = 0
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.LayoutRequest:
+                self.count += 1
+            return False
+
+    counter = Counter()
+    app.installEventFilter(counter)
+    return counter
+
+def settle(app, window, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+    return window
+
+def run():
+    env = loadMain()
+    app = application()
+    UIFunctions, Settings = env["UIFunctions"], env["Settings"]
+    Settings.PREBUILD_PAGES = False
+    # NOT LOADED: THE STORE NEVER WRITES THE USER'S SETTINGS FILE
+    env["settingsStore"].values["SESSION"] = SESSION
+    counter = layoutRequests(app)
+
+    results = {}
+    for mode in ("restore", "replay"):
+        Settings.RESTORE_SESSION = mode == "restore"
+        counter.count = 0
+        start = time.perf_counter()
+        with Quiet():
+            window = env["MainWindow"]()
+            if mode == "restore":
+                app.processEvents()
+            else:
+                app.processEvents()
+                UIFunctions.toggleMenu(window, True)
+                UIFunctions.toggleLeftBox(window, True)
+                window.ui.btn_widgets.click()
+                settle(app, window, Settings.TIME_ANIMATION / 1000 + 0.05)
+        elapsed = time.perf_counter() - start
+        state = UIFunctions.sessionState(window)
+        assert all(state[key] == value for key, value in SESSION.items()), state
+
+        results[f"{mode}_ms"] = elapsed * 1000
+        results[f"{mode}_layouts"] = counter.count
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+    for key, value in results.items():
+        print(f"{key:<16} {value:10.1f}")
+    return results
+
+if __name__ == "__main__":
+    run()
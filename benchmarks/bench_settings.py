@@ -0,0 +1,77 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SETTINGS STORE
+# Load time of a settings file, cost of one "set" (notification included)
+# and disk writes for a burst of changes, like dragging a slider.
+# Usage: python benchmarks/bench_settings.py
+# ///////////////////////////////////////////////////////////////
+
+import os
+import tempfile
+import time
+
+from common import application, timeit
+
+KEYS = 200
+BURST = 1000
+
+def run():
+    app = application()
+    from PySide6.QtCore import QEventLoop, QTimer
+    from modules import SettingsStore
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "settings.json")
+        store = SettingsStore(path, delay=100)
+        store.load()
+        for key in range(KEYS):
+            store.set(f"KEY_{key}", [key, str(key), key / 3])
+        store.flush()
+
+        reader = SettingsStore(path)
+        load = timeit(reader.load, number=20)
+
+        store.watch("SLIDER", lambda value: None)
+        counter = iter(range(10 ** 9))
+        setCost = timeit(lambda: store.set("SLIDER", next(counter)), number=BURST)
+        store.flush()
+
+        # BURST: ONE WRITE AFTER THE LAST CHANGE
+        writes = store.writes
+        start = time.perf_counter()
+        for value in range(BURST):
+            store.set("SLIDER", -value)
+        burst = time.perf_counter() - start
+        loop = QEventLoop()
+        store.saved.connect(loop.quit)
+        QTimer.singleShot(2000, loop.quit)
+        loop.exec()
+        store.writer.waitForDone()
+
+        results = {
+            "keys": KEYS,
+            "load_us": load * 1e6,
+            "set_us": setCost * 1e6,
+            "burst_ms": burst * 1000,
+            "burst_writes": store.writes - writes,
+        }
+    for key, value in results.items():
+        print(f"{key:<14} {value:10.1f}")
+    return results
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,54 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# REPAINT COST WITH THE DROP SHADOW AS EFFECT, CACHED OR OFF
+# "lineEdit" stands for a keystroke, "tableWidget" for a scroll step and
+# "window" for a full repaint.
+# Usage: python benchmarks/bench_shadow.py
+# ///////////////////////////////////////////////////////////////
+
+from common import Quiet, application, loadMain, timeit
+
+MODES = ("effect", "cached", "none")
+
+def run():
+    env = loadMain()
+    app = application()
+    Settings = env["Settings"]
+    Settings.PREBUILD_PAGES = False
+
+    results = {}
+    for mode in MODES:
+        Settings.SHADOW_MODE = mode
+        with Quiet():
+            window = env["MainWindow"]()
+            window.ui.btn_widgets.click()
+        app.processEvents()
+
+        ui = window.ui
+        results[mode] = {
+            "lineEdit_us": timeit(ui.lineEdit.repaint, number=50) * 1e6,
+            "tableWidget_us": timeit(ui.tableWidget.viewport().repaint, number=50) * 1e6,
+            "window_us": timeit(window.repaint, number=20) * 1e6,
+        }
+        print(f"{mode:<7} " + "  ".join(f"{k} {v:9.1f}" for k, v in results[mode].items()))
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return results
+
+if __name__ == "__main__":
+    run()
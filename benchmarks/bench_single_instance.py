@@ -0,0 +1,74 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SINGLE INSTANCE HANDOFF
+# Starts "main.py --single-instance" (own server name, offscreen), then
+# times a second launch that forwards "--page=widgets" and exits, and the
+# socket round trip alone. Compare "handoff_ms" with "first_paint_ms" of
+# "bench_startup.py".
+# Usage: python benchmarks/bench_single_instance.py [launches]
+# ///////////////////////////////////////////////////////////////
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from common import ROOT, timeit
+
+def run(launches = 5):
+    from PySide6.QtNetwork import QLocalServer
+    from single_instance import NAME_ENV, SingleInstance
+
+    name = f"pydracula-bench-{os.getpid()}"
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", **{NAME_ENV: name})
+    command = [sys.executable, os.path.join(ROOT, "main.py"), "--single-instance"]
+    client = SingleInstance(name)
+
+    first = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        start = time.perf_counter()
+        while not client.forward([]):
+            if first.poll() is not None or time.perf_counter() - start > 30:
+                raise RuntimeError("first instance did not start")
+            time.sleep(0.05)
+        listening = time.perf_counter() - start
+
+        times = []
+        for _ in range(launches):
+            start = time.perf_counter()
+            second = subprocess.run(command + ["--page=widgets"], cwd=ROOT, env=env, capture_output=True)
+            times.append(time.perf_counter() - start)
+            if second.returncode != 0 or first.poll() is not None:
+                raise RuntimeError("handoff failed")
+        roundTrip = timeit(lambda: client.forward(["--page=home"]), number=10, repeat=5)
+    finally:
+        first.terminate()
+        first.wait()
+        QLocalServer.removeServer(name)
+
+    results = {
+        "first_listen_ms": listening * 1000,
+        "handoff_ms": statistics.median(times) * 1000,
+        "forward_ms": roundTrip * 1000,
+    }
+    for key, value in results.items():
+        print(f"{key:<16} {value:8.1f}")
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
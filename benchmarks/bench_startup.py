@@ -0,0 +1,68 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# COLD START
+# Runs "main.py --trace-startup --exit-after-startup" in fresh processes
+# and reports the median time to first paint, the time spent importing
+# "modules"/"widgets", the number of loaded modules and the peak RSS.
+# Usage: python benchmarks/bench_startup.py [runs]
+# ///////////////////////////////////////////////////////////////
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT
+
+PHASES = ("load modules", "load widgets")
+
+def startOnce(folder):
+    path = os.path.join(folder, "trace.json")
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), f"--trace-startup={path}", "--exit-after-startup"],
+        cwd=ROOT, env=env, capture_output=True, check=True)
+    with open(path, encoding="utf-8") as file:
+        trace = json.load(file)
+
+    phases = {}
+    for event in trace["traceEvents"]:
+        if event.get("cat") == "phase":
+            phases[event["name"]] = event["dur"] / 1000
+    return trace["otherData"], phases
+
+def run(runs = 5):
+    samples = []
+    with tempfile.TemporaryDirectory() as folder:
+        for _ in range(runs):
+            samples.append(startOnce(folder))
+
+    results = {
+        "first_paint_ms": statistics.median(data["startup_ms"] for data, phases in samples),
+        "modules": samples[0][0]["modules"],
+    }
+    for phase in PHASES:
+        results[phase.replace(" ", "_") + "_ms"] = statistics.median(phases.get(phase, 0.0) for data, phases in samples)
+    if samples[0][0].get("max_rss_mb"):
+        results["max_rss_mb"] = statistics.median(data["max_rss_mb"] for data, phases in samples)
+    for key, value in results.items():
+        print(f"{key:<20} {value:10.1f}")
+    return results
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
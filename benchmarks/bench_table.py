@@ -0,0 +1,94 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# TABLE POPULATION
+# Time to load rows into the widgets page table and paint it: the column
+# model ("ColumnTableModel") for 1k/100k/1M rows, and QTableWidget items
+# for 1k/100k rows (1M items takes minutes and gigabytes).
+# Usage: python benchmarks/bench_table.py
+# ///////////////////////////////////////////////////////////////
+
+import array
+import time
+
+from common import Quiet, application, loadMain
+
+from PySide6.QtWidgets import QTableWidgetItem
+
+from modules import ColumnTableModel, replaceTableWidget
+
+ROWS = (1000, 100000, 1000000)
+ITEM_ROWS = (1000, 100000)
+
+def columns(rows):
+    return [
+        array.array("l", range(rows)),
+        ["Row %d" % i for i in range(rows)],
+        array.array("d", (i * 0.5 for i in range(rows))),
+        array.array("l", (i % 7 for i in range(rows))),
+    ]
+
+def loadModel(app, view, model, data):
+    start = time.perf_counter()
+    model.setColumns(data, ("0", "1", "2", "3"), (None, None, "{:.2f}", None))
+    view.viewport().repaint()
+    app.processEvents()
+    return time.perf_counter() - start
+
+def loadItems(app, table, data):
+    rows = len(data[0])
+    start = time.perf_counter()
+    table.setUpdatesEnabled(False)
+    table.setRowCount(rows)
+    for row in range(rows):
+        for column, values in enumerate(data):
+            table.setItem(row, column, QTableWidgetItem(str(values[row])))
+    table.setUpdatesEnabled(True)
+    table.viewport().repaint()
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    table.setRowCount(0)
+    app.processEvents()
+    return elapsed
+
+def run():
+    env = loadMain()
+    app = application()
+    env["Settings"].PREBUILD_PAGES = False
+    with Quiet():
+        window = env["MainWindow"]()
+        window.ui.btn_widgets.click()
+    app.processEvents()
+
+    results = {}
+    table = window.ui.tableWidget
+    for rows in ITEM_ROWS:
+        elapsed = loadItems(app, table, columns(rows))
+        results[f"items_{rows}_ms"] = elapsed * 1000
+        print(f"QTableWidget      {rows:>8} rows {elapsed * 1000:10.1f} ms")
+
+    model = ColumnTableModel()
+    view = replaceTableWidget(table, model)
+    app.processEvents()
+    for rows in ROWS:
+        elapsed = loadModel(app, view, model, columns(rows))
+        results[f"model_{rows}_ms"] = elapsed * 1000
+        print(f"ColumnTableModel  {rows:>8} rows {elapsed * 1000:10.1f} ms")
+    window.close()
+    return results
+
+if __name__ == "__main__":
+    run()
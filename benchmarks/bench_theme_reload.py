@@ -0,0 +1,89 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# THEME HOT RELOAD
+# Edits the color of the top menu buttons in a copy of the dark theme and
+# reloads it: "full" sets the new theme on "styleSheet" (whole window
+# re-polished), "incremental" is "ThemeWatcher" (only the subtrees matched
+# by the changed rule). Every page is built first.
+# Usage: python benchmarks/bench_theme_reload.py
+# ///////////////////////////////////////////////////////////////
+
+import os
+import shutil
+import tempfile
+import time
+
+from common import Quiet, ROOT, application, loadMain
+
+EDITS = 20
+RULE = "#topMenu .QPushButton{"
+
+def writeTheme(path, source, index):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source.replace(RULE, RULE + f" color: rgb({index % 256}, 200, 200);", 1))
+    # NEW MODIFICATION TIME FOR "themeManager.load"
+    os.utime(path, ns=(index * 10 ** 9, index * 10 ** 9))
+
+def run():
+    env = loadMain()
+    app = application()
+    from PySide6.QtWidgets import QWidget
+    Settings, themeManager = env["Settings"], env["themeManager"]
+    Settings.RESTORE_SESSION = False
+    with open(os.path.join(ROOT, Settings.DEFAULT_THEME), "r", encoding="utf-8") as f:
+        source = f.read()
+    if RULE not in source:
+        raise SystemExit(f'No "{RULE}" rule in "{Settings.DEFAULT_THEME}"')
+
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "theme.qss")
+        writeTheme(path, source, 0)
+        with Quiet():
+            window = env["MainWindow"]()
+            for page in window.ui.pendingPages():
+                window.setupPage(page)
+            themeManager.apply(window.ui.styleSheet, path)
+            app.processEvents()
+
+            results = {}
+            for mode in ("full", "incremental"):
+                # CREATED LAST: ITS FILE WATCHER WOULD ALSO RELOAD THE "full" EDITS
+                watcher = env["ThemeWatcher"](window.ui.styleSheet, window) if mode == "incremental" else None
+                start = time.perf_counter()
+                for index in range(1, EDITS + 1):
+                    writeTheme(path, source, index)
+                    if mode == "full":
+                        themeManager.apply(window.ui.styleSheet, path)
+                    else:
+                        watcher.reload()
+                    app.processEvents()
+                results[f"{mode}_ms"] = (time.perf_counter() - start) * 1000 / EDITS
+                results[f"{mode}_widgets"] = watcher.repolished if watcher else len(window.ui.styleSheet.findChildren(QWidget)) + 1
+
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    finally:
+        shutil.rmtree(folder)
+
+    for key, value in results.items():
+        print(f"{key:<20} {value:10.1f}")
+    return results
+
+if __name__ == "__main__":
+    run()
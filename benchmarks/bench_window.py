@@ -0,0 +1,127 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# MAIN WINDOW COSTS
+# - construction: "MainWindow()" (first one in the process and median)
+# - page switch: "buttonClick" through a real click, until painted
+# - theme: "UIFunctions.theme" switching between both themes, and
+#   re-applying the active one
+# - grips: "CustomGrip" drag moves per second (coalesced to one geometry
+#   per frame) and the cost of one applied resize
+# Usage: python benchmarks/bench_window.py
+# ///////////////////////////////////////////////////////////////
+
+import itertools
+import statistics
+import time
+
+from common import Quiet, application, loadMain, timeit
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+
+def construction(env, app, count = 5):
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        with Quiet():
+            window = env["MainWindow"]()
+        app.processEvents()
+        times.append(time.perf_counter() - start)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return times[0], statistics.median(times[1:])
+
+def pageSwitch(window, app):
+    buttons = itertools.cycle((window.ui.btn_widgets, window.ui.btn_new, window.ui.btn_home))
+    def click():
+        next(buttons).click()
+        app.processEvents()
+    with Quiet():
+        click(); click(); click()
+        return timeit(click, number=30)
+
+def theme(env, window, app):
+    UIFunctions = env["UIFunctions"]
+    files = itertools.cycle(("themes/py_dracula_light.qss", "themes/py_dracula_dark.qss"))
+    def switch():
+        UIFunctions.theme(window, next(files), True)
+        app.processEvents()
+    switch()
+    switching = timeit(switch, number=4, repeat=3)
+    reapply = timeit(lambda: UIFunctions.theme(window, "themes/py_dracula_dark.qss", True), number=50)
+    return switching, reapply
+
+def grips(window, app, moves = 200):
+    grip = window.right_grip
+    window.resize(1000, 720)
+    app.processEvents()
+
+    def move(dx):
+        event = QMouseEvent(QEvent.MouseMove, QPointF(dx, 5), QPointF(dx, 5), Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+        grip.wi.rightgrip.mouseMoveEvent(event)
+
+    # DRAG: ONE MOVE PER EVENT LOOP PASS, LIKE A FAST MOUSE
+    start = time.perf_counter()
+    for i in range(moves):
+        move(1 if (i // 50) % 2 == 0 else -1)
+        app.processEvents()
+    grip.mouseReleaseEvent(None)
+    app.processEvents()
+    movesPerSecond = moves / (time.perf_counter() - start)
+
+    # ONE APPLIED RESIZE (GEOMETRY, LAYOUT AND PAINT)
+    widths = itertools.cycle((1000, 1010))
+    def resize():
+        geometry = window.geometry()
+        geometry.setWidth(next(widths))
+        grip.engine.setGeometry(geometry)
+        grip.engine.commit()
+        app.processEvents()
+    applied = timeit(resize, number=10)
+    return movesPerSecond, applied
+
+def run():
+    env = loadMain()
+    app = application()
+    env["Settings"].PREBUILD_PAGES = False
+
+    first, median = construction(env, app)
+    with Quiet():
+        window = env["MainWindow"]()
+    app.processEvents()
+
+    switch = pageSwitch(window, app)
+    themeSwitch, themeReapply = theme(env, window, app)
+    movesPerSecond, applied = grips(window, app)
+    window.close()
+
+    results = {
+        "construct_first_ms": first * 1000,
+        "construct_ms": median * 1000,
+        "page_switch_ms": switch * 1000,
+        "theme_switch_ms": themeSwitch * 1000,
+        "theme_reapply_us": themeReapply * 1e6,
+        "grip_moves_per_s": movesPerSecond,
+        "grip_resize_ms": applied * 1000,
+    }
+    for key, value in results.items():
+        print(f"{key:<20} {value:10.2f}")
+    return results
+
+if __name__ == "__main__":
+    run()
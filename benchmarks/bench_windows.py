@@ -0,0 +1,75 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# MEMORY PER WINDOW: ONE PROCESS WITH N WINDOWS VS N PROCESSES
+# In process: resident memory after the first window and after N windows
+# opened by WindowManager (all shown and painted). Separate processes:
+# resident memory of a process running one window, which is what every
+# extra process costs.
+# Usage: python benchmarks/bench_windows.py [windows]
+# ///////////////////////////////////////////////////////////////
+
+import gc
+import os
+import subprocess
+import sys
+
+from common import Quiet, application, currentMemory, loadMain
+
+def settle(app):
+    for _ in range(5):
+        app.processEvents()
+    gc.collect()
+
+def openWindows(count):
+    env = loadMain()
+    app = application()
+    env["Settings"].PREBUILD_PAGES = False
+    manager = env["WindowManager"](env["MainWindow"])
+
+    memory = []
+    with Quiet():
+        for _ in range(count):
+            window = manager.createWindow()
+            window.ui.btn_widgets.click()
+            settle(app)
+            memory.append(currentMemory())
+    return memory
+
+def processMemory():
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+        capture_output=True, text=True, check=True).stdout
+    return float(output.split()[-1])
+
+def run(count = 8):
+    memory = openWindows(count)
+    perWindow = (memory[-1] - memory[0]) / (count - 1)
+    perProcess = processMemory()
+    results = {
+        "first_window_mb": memory[0],
+        "per_extra_window_mb": perWindow,
+        "per_process_mb": perProcess,
+    }
+    print(f"first window        {memory[0]:8.1f} MB (whole process)")
+    print(f"each extra window   {perWindow:8.1f} MB ({count} windows in one process: {memory[-1]:.1f} MB)")
+    print(f"each extra process  {perProcess:8.1f} MB ({count} processes: {perProcess * count:.1f} MB)")
+    return results
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--child"]:
+        print(openWindows(1)[0])
+    else:
+        run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,74 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SHARED BENCHMARK HELPERS
+# ///////////////////////////////////////////////////////////////
+
+import os
+import runpy
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# HEADLESS BY DEFAULT
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# QAPPLICATION
+# ///////////////////////////////////////////////////////////////
+def application():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([sys.argv[0]])
+
+# LOAD "main.py" WITHOUT RUNNING ITS "__main__" BLOCK
+# ///////////////////////////////////////////////////////////////
+def loadMain():
+    application()
+    return runpy.run_path(os.path.join(ROOT, "main.py"), run_name="benchmark")
+
+# SILENCE PRINTS FROM EVENT HANDLERS
+# ///////////////////////////////////////////////////////////////
+class Quiet():
+    def __enter__(self):
+        self.stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+        return self
+
+    def __exit__(self, *args):
+        sys.stdout.close()
+        sys.stdout = self.stdout
+
+# CURRENT RESIDENT MEMORY IN MB (LINUX)
+# ///////////////////////////////////////////////////////////////
+def currentMemory():
+    with open("/proc/self/statm") as statm:
+        pages = int(statm.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+# TIMING
+# Returns seconds per call (median of "repeat" rounds of "number" calls).
+# ///////////////////////////////////////////////////////////////
+def timeit(func, number=100, repeat=5):
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    rounds.sort()
+    return rounds[len(rounds) // 2]
@@ -0,0 +1,169 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# HEADLESS BENCHMARK SUITE
+# Runs each benchmark in its own process (offscreen QPA platform), writes
+# every metric to one JSON file and compares it with a baseline:
+#
+#   python benchmarks/suite.py -o results.json
+#   python benchmarks/suite.py -o new.json --baseline results.json
+#
+# Metrics ending in "_ms", "_us" or "_s" are lower-is-better, "_per_s"
+# higher-is-better. A metric regresses when it is worse than the baseline
+# by more than "--tolerance" (relative) and, for times, by more than
+# "--min-delta" milliseconds; the exit code is 1 if any metric regressed.
+# "--repeat 3" keeps the best of 3 runs per metric to reduce noise.
+# ///////////////////////////////////////////////////////////////
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT
+
+BENCHMARKS = ("bench_startup", "bench_window", "bench_navigation", "bench_panels", "bench_shadow", "bench_table")
+OPTIONAL = ("bench_resources", "bench_log_console", "bench_asyncio", "bench_single_instance", "bench_icons", "bench_settings", "bench_session", "bench_theme_reload", "bench_windows")
+
+# FLATTEN {"effect": {"window_us": 1}} TO {"effect/window_us": 1}
+# ///////////////////////////////////////////////////////////////
+def flatten(results, prefix = ""):
+    metrics = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, name + "/"))
+        elif isinstance(value, (int, float)) and direction(name):
+            metrics[name] = float(value)
+    return metrics
+
+# MILLISECONDS PER UNIT OF A TIME METRIC
+UNITS = {"_ms": 1.0, "_us": 0.001, "_s": 1000.0}
+
+def milliseconds(name, value):
+    for suffix, scale in UNITS.items():
+        if name.endswith(suffix):
+            return value * scale
+    return value
+
+# 1: HIGHER IS BETTER, -1: LOWER IS BETTER (TIMES, MEMORY IN MB), 0: NOT A METRIC
+def direction(name):
+    if name.endswith("_per_s"):
+        return 1
+    if name.endswith(("_ms", "_us", "_s", "_mb")):
+        return -1
+    return 0
+
+# "--min-delta" ONLY APPLIES TO TIMES
+def isTime(name):
+    return direction(name) < 0 and name.endswith(tuple(UNITS))
+
+# CHILD PROCESS: RUN ONE BENCHMARK, WRITE ITS RESULTS
+# ///////////////////////////////////////////////////////////////
+def runChild(name, output):
+    results = importlib.import_module(name).run()
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(flatten(results), file)
+
+def runBenchmark(name, verbose):
+    with tempfile.TemporaryDirectory() as folder:
+        output = os.path.join(folder, "results.json")
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        process = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", name, output],
+            cwd=ROOT, env=env, capture_output=not verbose, text=True)
+        if process.returncode != 0 or not os.path.isfile(output):
+            raise RuntimeError(f"{name} failed:\n{process.stderr or ''}")
+        with open(output, encoding="utf-8") as file:
+            return json.load(file)
+
+def gitCommit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+# COMPARE WITH A BASELINE
+# ///////////////////////////////////////////////////////////////
+def compare(metrics, baseline, tolerance, minDelta):
+    regressions = []
+    for name, value in sorted(metrics.items()):
+        if name not in baseline:
+            continue
+        old = baseline[name]
+        sign = direction(name)
+        worse = (old - value) if sign > 0 else (value - old)
+        change = worse / old if old else 0.0
+        status = "ok"
+        if worse > 0 and change > tolerance and (not isTime(name) or milliseconds(name, worse) > minDelta):
+            status = "REGRESSION"
+            regressions.append(name)
+        print(f"{status:<10} {name:<50} {old:12.2f} -> {value:12.2f} ({change * 100:+.1f}% worse)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless PyDracula benchmark suite")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="JSON file to write")
+    parser.add_argument("-b", "--baseline", help="JSON file from a previous run to compare with")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.25, help="allowed relative slowdown (default 0.25)")
+    parser.add_argument("--min-delta", type=float, default=1.0, help="ignore slowdowns below this many ms (default 1.0)")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="runs per benchmark, the best value is kept (default 1)")
+    parser.add_argument("-k", "--only", nargs="+", help="benchmarks to run (default: %s; also: %s)" % (", ".join(BENCHMARKS), ", ".join(OPTIONAL)))
+    parser.add_argument("-v", "--verbose", action="store_true", help="show benchmark output")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return runChild(*args.child)
+
+    import PySide6
+    metrics = {}
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...", flush=True)
+        for _ in range(args.repeat):
+            for key, value in runBenchmark(name, args.verbose).items():
+                key = f"{name}/{key}"
+                best = max if direction(key) > 0 else min
+                metrics[key] = best(metrics.get(key, value), value)
+
+    report = {
+        "commit": gitCommit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "platform": platform.platform(),
+        "metrics": metrics,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+    print(f"{len(metrics)} metrics written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["metrics"]
+        regressions = compare(metrics, baseline, args.tolerance, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} regression(s)")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+# PATHS
+# ///////////////////////////////////////////////////////////////
+ROOT = os.path.dirname(os.path.abspath(__file__))
+QRC_FILE = os.path.join(ROOT, "resources.qrc")
+RCC_FILE = os.path.join(ROOT, "resources.rcc")
+ATLAS_FILE = os.path.join(ROOT, "icons_atlas.png")
+ATLAS_WIDTH = 256
+THEMES_DIR = os.path.join(ROOT, "themes")
+THEMES_SRC = os.path.join(THEMES_DIR, "src")
+
+# COMPILE "resources.qrc" TO A BINARY ".rcc"
+# Loaded at runtime by "modules/resources_loader.py".
+# ///////////////////////////////////////////////////////////////
+def build(qrc=QRC_FILE, output=RCC_FILE):
+    subprocess.check_call(["pyside6-rcc", "--binary", qrc, "-o", output], cwd=ROOT)
+    return output
+
+# PACK THE ":/icons" IMAGES OF "resources.qrc" INTO ONE SPRITE ATLAS
+# Writes "icons_atlas.png" and "icons_atlas.json" (name: [x, y, w, h]),
+# loaded at runtime by "modules/icon_cache.py". Shelf packing: icons
+# sorted by height fill rows of ATLAS_WIDTH pixels.
+# ///////////////////////////////////////////////////////////////
+def iconFiles(qrc=QRC_FILE):
+    files = []
+    for resource in ElementTree.parse(qrc).getroot().iter("qresource"):
+        if resource.get("prefix") == "icons":
+            files.extend(os.path.join(ROOT, file.text) for file in resource.iter("file"))
+    return files
+
+def buildAtlas(qrc=QRC_FILE, output=ATLAS_FILE, width=ATLAS_WIDTH):
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage, QPainter
+
+    images = [(os.path.splitext(os.path.basename(file))[0], QImage(file)) for file in iconFiles(qrc)]
+    images.sort(key=lambda item: (-item[1].height(), -item[1].width(), item[0]))
+
+    rects = {}
+    x = y = rowHeight = 0
+    for name, image in images:
+        if x + image.width() > width:
+            x, y, rowHeight = 0, y + rowHeight, 0
+        rects[name] = [x, y, image.width(), image.height()]
+        x += image.width()
+        rowHeight = max(rowHeight, image.height())
+
+    atlas = QImage(width, y + rowHeight, QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.transparent)
+    painter = QPainter(atlas)
+    painter.setCompositionMode(QPainter.CompositionMode_Source)
+    for name, image in images:
+        painter.drawImage(rects[name][0], rects[name][1], image)
+    painter.end()
+
+    if not atlas.save(output):
+        raise OSError(f'Can not write "{output}"')
+    with open(os.path.splitext(output)[0] + ".json", "w", encoding="utf-8") as file:
+        json.dump(rects, file, sort_keys=True)
+    return output, len(rects)
+
+# COMPILE THEME TEMPLATES
+# "themes/src/<template>.qss" uses "@token" values from the palettes
+# "themes/src/<template>_<variant>.json" ({"token": "value"}), each one
+# compiled to "themes/<template>_<variant>.qss". A "null" token removes
+# the declarations using it, so variants need no override style sheets.
+# Output is minified, one rule per line: comments, empty rules and
+# properties set again later in the same rule are dropped.
+# ///////////////////////////////////////////////////////////////
+COMMENT = re.compile(r"/\*.*?\*/", re.S)
+RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+DECLARATION = re.compile(r"""(?:[^;"']|"[^"]*"|'[^']*')+""")
+TOKEN = re.compile(r"@([A-Za-z_]\w*)")
+SEPARATOR = re.compile(r"\s*([,>])\s*")
+
+def compileTheme(template, palette, name = "theme"):
+    rules = []
+    for selector, body in RULE.findall(COMMENT.sub("", template)):
+        selector = SEPARATOR.sub(r"\1", " ".join(selector.split()))
+        declarations = {}
+        for declaration in DECLARATION.findall(body):
+            prop, colon, value = declaration.partition(":")
+            if not colon:
+                continue
+            tokens = TOKEN.findall(value)
+            for token in tokens:
+                if token not in palette:
+                    raise ValueError(f'{name}: unknown token "@{token}" in "{selector}"')
+            if any(palette[token] is None for token in tokens):
+                continue
+            value = TOKEN.sub(lambda match: str(palette[match.group(1)]), value)
+            # LAST ONE WINS, KEEP ITS POSITION (SHORTHANDS BEFORE LONGHANDS)
+            declarations.pop(prop.strip(), None)
+            declarations[prop.strip()] = " ".join(value.split())
+        if declarations:
+            rules.append(selector + "{" + ";".join(f"{prop}:{value}" for prop, value in declarations.items()) + "}")
+    return "\n".join(rules) + "\n"
+
+# ONE THEME: "<output>/<palette name>.qss"
+# Also used by "modules/theme_watcher.py" when a source is saved.
+def buildTheme(template, palette, output = THEMES_DIR):
+    base = os.path.splitext(os.path.basename(template))[0]
+    name = os.path.splitext(os.path.basename(palette))[0]
+    with open(template, "r", encoding="utf-8") as f:
+        text = f.read()
+    with open(palette, "r", encoding="utf-8") as f:
+        qss = compileTheme(text, json.load(f), name)
+    header = f"/* GENERATED BY build_resources.py FROM src/{base}.qss + src/{name}.json, EDIT THOSE */\n"
+    path = os.path.join(output, name + ".qss")
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(header + qss)
+    return path
+
+def buildThemes(source = THEMES_SRC, output = THEMES_DIR):
+    files = []
+    for template in sorted(glob.glob(os.path.join(source, "*.qss"))):
+        base = os.path.splitext(os.path.basename(template))[0]
+        for palette in sorted(glob.glob(os.path.join(source, base + "_*.json"))):
+            files.append(buildTheme(template, palette, output))
+    return files
+
+if __name__ == "__main__":
+    # "--themes": ONLY COMPILE THE THEMES (NO QT TOOLS NEEDED)
+    if sys.argv[1:] != ["--themes"]:
+        output = build(*sys.argv[1:3])
+        print(f'Resources compiled: "{output}" ({os.path.getsize(output)} bytes)')
+        atlas, count = buildAtlas()
+        print(f'Icon atlas: "{atlas}" ({count} icons, {os.path.getsize(atlas)} bytes)')
+    for theme in buildThemes():
+        print(f'Theme compiled: "{theme}" ({os.path.getsize(theme)} bytes)')
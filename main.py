@@ -15,28 +15,57 @@
 # ///////////////////////////////////////////////////////////////
 
 import sys
+
+# STARTUP TRACE (IMPORTED FIRST TO TIME EVERY OTHER IMPORT)
+# Run "python main.py --trace-startup" to write "startup_trace.json"
+# ///////////////////////////////////////////////////////////////
+from startup_trace import tracer
+tracer.configure(sys.argv)
+
 import os
+
+# SINGLE INSTANCE (OPT-IN: "--single-instance" OR PYDRACULA_SINGLE_INSTANCE=1)
+# A second launch hands its arguments to the running window and exits
+# before loading the modules. Imported only when enabled (QtNetwork).
+# ///////////////////////////////////////////////////////////////
+instance = None
+if "--single-instance" in sys.argv[1:] or os.environ.get("PYDRACULA_SINGLE_INSTANCE", "").lower() in ("1", "true", "yes"):
+    from single_instance import instance
+    instance.configure(sys.argv)
+    if __name__ == "__main__" and instance.forward(sys.argv[1:]):
+        sys.exit(0)
+
 import platform
+import logging
+import asyncio
+import functools
 
 # IMPORT / GUI AND MODULES AND WIDGETS
 # ///////////////////////////////////////////////////////////////
-from modules import *
-from widgets import *
-os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QHeaderView, QMainWindow
+
+with tracer.phase("load modules"):
+    from modules import *
+with tracer.phase("load widgets"):
+    from widgets import *
 
-# SET AS GLOBAL WIDGETS
+# LOGGER
 # ///////////////////////////////////////////////////////////////
-widgets = None
+log = logging.getLogger("PyDracula")
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # "session": SETTINGS KEY OF THE SAVED SESSION (ONE PER WINDOW, SEE WindowManager)
+    def __init__(self, session = "SESSION"):
         QMainWindow.__init__(self)
+        self.sessionKey = session
 
-        # SET AS GLOBAL WIDGETS
+        # SET WIDGETS (PER WINDOW, SEVERAL WINDOWS CAN RUN IN ONE PROCESS)
         # ///////////////////////////////////////////////////////////////
         self.ui = Ui_MainWindow()
-        self.ui.setupUi(self)
-        global widgets
+        with tracer.phase("setupUi"):
+            self.ui.setupUi(self)
         widgets = self.ui
 
         # USE CUSTOM TITLE BAR | USE AS "False" FOR MAC OR LINUX
@@ -51,27 +80,65 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(title)
         widgets.titleRightInfo.setText(description)
 
+        # LOG CONSOLE
+        # Python logging is shown in "plainTextEdit" once its page is built
+        # ///////////////////////////////////////////////////////////////
+        self.logConsole = LogConsole(maxLines=Settings.LOG_CONSOLE_LINES)
+        self.logConsole.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s", "%H:%M:%S"))
+        logging.getLogger().addHandler(self.logConsole)
+
+        # BACKGROUND TASKS
+        # Progress is shown in the bottom bar, "Esc" cancels running tasks
+        # ///////////////////////////////////////////////////////////////
+        self.tasks = TaskRunner(self)
+        self.tasks.signals.started.connect(self.taskStarted)
+        self.tasks.signals.progress.connect(self.taskProgress)
+        self.tasks.signals.finished.connect(lambda name, result: self.taskEnded(name, "done"))
+        self.tasks.signals.failed.connect(self.taskFailed)
+        self.tasks.signals.cancelled.connect(lambda name: self.taskEnded(name, "cancelled"))
+        self.bottomBarTexts = (widgets.creditsLabel.text(), widgets.version.text())
+
+        # PERFORMANCE MONITOR
+        # HUD toggled by "btn_hud" in the settings box. Set "PYDRACULA_PERF_LOG"
+        # (or Settings.PERF_LOG_FILE) to write the same metrics to a file
+        # ///////////////////////////////////////////////////////////////
+        self.perfMonitor = PerfMonitor(self)
+        self.perfHud = PerfHud(widgets.bgApp, self.perfMonitor)
+        widgets.btn_hud.toggled.connect(self.perfHud.setActive)
+        widgets.btn_hud.toggled.connect(lambda checked: settingsStore.set("PERF_HUD", checked))
+        widgets.btn_hud.setChecked(Settings.PERF_HUD)
+        settingsStore.watch("PERF_HUD", widgets.btn_hud.setChecked)
+        perfLog = Settings.PERF_LOG_FILE or os.environ.get("PYDRACULA_PERF_LOG")
+        if perfLog:
+            self.perfMonitor.startFile(perfLog)
+
         # TOGGLE MENU
         # ///////////////////////////////////////////////////////////////
         widgets.toggleButton.clicked.connect(lambda: UIFunctions.toggleMenu(self, True))
 
         # SET UI DEFINITIONS
         # ///////////////////////////////////////////////////////////////
-        UIFunctions.uiDefinitions(self)
-
-        # QTableWidget PARAMETERS
-        # ///////////////////////////////////////////////////////////////
-        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        with tracer.phase("uiDefinitions"):
+            UIFunctions.uiDefinitions(self)
 
         # BUTTONS CLICK
         # ///////////////////////////////////////////////////////////////
 
+        # PAGES
+        UIFunctions.registerPage(self, widgets.btn_home, widgets.home)
+        UIFunctions.registerPage(self, widgets.btn_widgets, widgets.widgets)
+        UIFunctions.registerPage(self, widgets.btn_new, widgets.new_page)
+
         # LEFT MENUS
         widgets.btn_home.clicked.connect(self.buttonClick)
         widgets.btn_widgets.clicked.connect(self.buttonClick)
         widgets.btn_new.clicked.connect(self.buttonClick)
         widgets.btn_save.clicked.connect(self.buttonClick)
 
+        # EXTRA TOP MENU (ASYNC SLOTS)
+        for button in (widgets.btn_share, widgets.btn_adjustments, widgets.btn_more):
+            button.clicked.connect(functools.partial(self.extraMenuClick, button))
+
         # EXTRA LEFT BOX
         def openCloseLeftBox():
             UIFunctions.toggleLeftBox(self, True)
@@ -83,27 +150,107 @@ class MainWindow(QMainWindow):
             UIFunctions.toggleRightBox(self, True)
         widgets.settingsTopBtn.clicked.connect(openCloseRightBox)
 
-        # SHOW APP
-        # ///////////////////////////////////////////////////////////////
-        self.show()
-
         # SET CUSTOM THEME
+        # Themes are compiled from "themes/src" (python build_resources.py --themes)
         # ///////////////////////////////////////////////////////////////
         useCustomTheme = False
-        themeFile = "themes\py_dracula_light.qss"
+        themeFile = "themes/py_dracula_light.qss"
 
-        # SET THEME AND HACKS
-        if useCustomTheme:
-            # LOAD AND APPLY STYLE
-            UIFunctions.theme(self, themeFile, True)
+        # LOAD AND APPLY STYLE
+        UIFunctions.theme(self, themeFile, useCustomTheme)
 
-            # SET HACKS
-            AppFunctions.setThemeHack(self)
+        # THEME HOT RELOAD
+        # Edits of the theme file are applied to the running window
+        # ///////////////////////////////////////////////////////////////
+        self.themeWatcher = None
+        if Settings.THEME_HOT_RELOAD or os.environ.get("PYDRACULA_THEME_RELOAD"):
+            self.themeWatcher = ThemeWatcher(widgets.styleSheet, self)
 
         # SET HOME PAGE AND SELECT MENU
         # ///////////////////////////////////////////////////////////////
         widgets.stackedWidget.setCurrentWidget(widgets.home)
-        widgets.btn_home.setStyleSheet(UIFunctions.selectMenu(widgets.btn_home.styleSheet()))
+        UIFunctions.selectMenuButton(self, widgets.btn_home)
+
+        # RESTORE LAST SESSION (GEOMETRY, MAXIMIZED, PANELS, PAGE)
+        # Before "show", without animations: one layout pass
+        # ///////////////////////////////////////////////////////////////
+        if Settings.RESTORE_SESSION:
+            with tracer.phase("restoreSession"):
+                UIFunctions.restoreSession(self, settingsStore.get(self.sessionKey))
+
+        # SHOW APP
+        # ///////////////////////////////////////////////////////////////
+        tracer.watchFirstPaint(self)
+        with tracer.phase("show"):
+            if UIFunctions.returStatus(self):
+                self.showMaximized()
+            else:
+                self.show()
+
+        # BUILD REMAINING PAGES WHEN IDLE
+        # ///////////////////////////////////////////////////////////////
+        if Settings.PREBUILD_PAGES:
+            QTimer.singleShot(0, self.prebuildPages)
+
+    # LAZY PAGES
+    # Pages are built the first time they are shown, set page parameters here
+    # ///////////////////////////////////////////////////////////////
+    def setupPage(self, page):
+        if not self.ui.setupPage(page):
+            return
+
+        if page == self.ui.widgets:
+            # QTableWidget PARAMETERS
+            self.ui.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+            # COLUMN MODEL FOR LARGE TABLES, FILL IT WITH "self.tableModel.setColumns"
+            if Settings.TABLE_MODEL:
+                self.replaceTable()
+
+            # LOG CONSOLE
+            self.logConsole.setWidget(self.ui.plainTextEdit)
+
+        # PAGE BUILT AFTER A THEME RELOAD
+        if self.themeWatcher:
+            self.themeWatcher.refresh(page)
+
+    def replaceTable(self):
+        from modules import ColumnTableModel, replaceTableWidget
+        table = self.ui.tableWidget
+        headers = [table.horizontalHeaderItem(column).text() if table.horizontalHeaderItem(column) else str(column) for column in range(table.columnCount())]
+        columns = [[table.item(row, column).text() if table.item(row, column) else "" for row in range(table.rowCount())] for column in range(table.columnCount())]
+        self.tableModel = ColumnTableModel(columns, headers)
+        self.ui.tableWidget = replaceTableWidget(table, self.tableModel)
+
+    def showPage(self, page):
+        self.setupPage(page)
+        self.ui.stackedWidget.setCurrentWidget(page)
+
+    # COMMAND LINE ARGUMENTS
+    # "--page=<name>" shows the page of "btn_<name>", other arguments are
+    # files. Also receives the arguments of later launches (single instance)
+    # ///////////////////////////////////////////////////////////////
+    def openArguments(self, argv, cwd = None):
+        for arg in argv:
+            if arg.startswith("--page="):
+                if not UIFunctions.navigate(self, "btn_" + arg.partition("=")[2]):
+                    log.warning(f'Unknown page "{arg}"')
+            elif not arg.startswith("-"):
+                AppFunctions.openFile(self, os.path.join(cwd or os.getcwd(), arg))
+
+    def activate(self):
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def prebuildPages(self):
+        # ONE PAGE PER IDLE CALL TO KEEP THE EVENT LOOP RESPONSIVE
+        pages = self.ui.pendingPages()
+        if pages:
+            self.setupPage(pages[0])
+        if len(pages) > 1:
+            QTimer.singleShot(0, self.prebuildPages)
 
 
     # BUTTONS CLICK
@@ -114,30 +261,69 @@ class MainWindow(QMainWindow):
         btn = self.sender()
         btnName = btn.objectName()
 
-        # SHOW HOME PAGE
-        if btnName == "btn_home":
-            widgets.stackedWidget.setCurrentWidget(widgets.home)
-            UIFunctions.resetStyle(self, btnName)
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
+        # SHOW PAGE OF THE BUTTON (HOME, WIDGETS, NEW...)
+        # Register new pages with "UIFunctions.registerPage"
+        UIFunctions.navigate(self, btnName)
 
-        # SHOW WIDGETS PAGE
-        if btnName == "btn_widgets":
-            widgets.stackedWidget.setCurrentWidget(widgets.widgets)
-            UIFunctions.resetStyle(self, btnName)
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet()))
+        if btnName == "btn_save":
+            log.info("Save BTN clicked!")
+            self.tasks.submit("save", AppFunctions.saveWork)
 
-        # SHOW NEW PAGE
-        if btnName == "btn_new":
-            widgets.stackedWidget.setCurrentWidget(widgets.new_page) # SET PAGE
-            UIFunctions.resetStyle(self, btnName) # RESET ANOTHERS BUTTONS SELECTED
-            btn.setStyleSheet(UIFunctions.selectMenu(btn.styleSheet())) # SELECT MENU
+        # PRINT BTN NAME
+        log.info(f'Button "{btnName}" pressed!')
 
-        if btnName == "btn_save":
-            print("Save BTN clicked!")
+    # ASYNC BUTTONS CLICK
+    # Runs on the GUI thread, "await" I/O here without blocking the window
+    # ///////////////////////////////////////////////////////////////
+    @asyncSlot
+    async def extraMenuClick(self, btn, *args):
+        btnName = btn.objectName()
+        await asyncio.sleep(0)
 
         # PRINT BTN NAME
-        print(f'Button "{btnName}" pressed!')
+        log.info(f'Button "{btnName}" pressed!')
+
+    # BACKGROUND TASKS
+    # Only posted results reach the GUI thread
+    # ///////////////////////////////////////////////////////////////
+    def taskStarted(self, name):
+        self.ui.creditsLabel.setText(f"{name.capitalize()}...")
+        self.ui.version.setText("0%")
 
+    def taskProgress(self, name, value, text):
+        if text:
+            self.ui.creditsLabel.setText(text)
+        self.ui.version.setText(f"{value}%")
+
+    def taskFailed(self, name, error):
+        log.error(f'Task "{name}" failed:\n{error}')
+        self.taskEnded(name, "failed")
+
+    def taskEnded(self, name, status):
+        log.info(f'Task "{name}" {status}')
+        if not self.tasks.running:
+            self.ui.creditsLabel.setText(self.bottomBarTexts[0])
+            self.ui.version.setText(self.bottomBarTexts[1])
+
+    # CLOSE EVENT
+    # ///////////////////////////////////////////////////////////////
+    def closeEvent(self, event):
+        if Settings.RESTORE_SESSION:
+            settingsStore.set(self.sessionKey, UIFunctions.sessionState(self))
+        self.tasks.cancelAll()
+        self.tasks.waitForDone()
+        self.perfMonitor.stopFile()
+        logging.getLogger().removeHandler(self.logConsole)
+        settingsStore.unwatch("PERF_HUD", self.ui.btn_hud.setChecked)
+        QMainWindow.closeEvent(self, event)
+
+    # KEY EVENTS
+    # ///////////////////////////////////////////////////////////////
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape and self.tasks.running:
+            self.tasks.cancelAll()
+            return
+        QMainWindow.keyPressEvent(self, event)
 
     # RESIZE EVENTS
     # ///////////////////////////////////////////////////////////////
@@ -153,12 +339,35 @@ class MainWindow(QMainWindow):
 
         # PRINT MOUSE EVENTS
         if event.buttons() == Qt.LeftButton:
-            print('Mouse click: LEFT CLICK')
+            log.info('Mouse click: LEFT CLICK')
         if event.buttons() == Qt.RightButton:
-            print('Mouse click: RIGHT CLICK')
+            log.info('Mouse click: RIGHT CLICK')
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("icon.ico"))
-    window = MainWindow()
-    sys.exit(app.exec_())
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with tracer.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setWindowIcon(QIcon("icon.ico"))
+    with tracer.phase("settings"):
+        settingsStore.load()
+        settingsStore.bind(Settings)
+    loop = QtEventLoop(app)
+    asyncio.set_event_loop(loop)
+    windows = WindowManager(MainWindow)
+    with tracer.phase("MainWindow"):
+        if Settings.WINDOW_PER_SCREEN:
+            windows.openOnAllScreens()
+        else:
+            windows.createWindow()
+    windows.activeWindow().openArguments(sys.argv[1:])
+    if instance is not None and instance.listen():
+        def openForwarded(argv, cwd):
+            window = windows.activeWindow() or windows.createWindow()
+            window.openArguments(argv, cwd)
+            window.activate()
+        instance.messageReceived.connect(openForwarded)
+    exitCode = loop.run_forever()
+    settingsStore.flush()
+    if instance is not None:
+        instance.close()
+    sys.exit(exitCode)
@@ -13,18 +13,84 @@
 # https://doc.qt.io/qtforpython/licenses.html
 #
 # ///////////////////////////////////////////////////////////////
-from PySide6.QtCore import *
-from PySide6.QtGui import *
-from PySide6.QtWidgets import *
-
 # GUI FILE
 from . ui_main import Ui_MainWindow
 
 # APP SETTINGS
 from . app_settings import Settings
 
+# SETTINGS FILE
+from . settings_store import SettingsStore, settingsStore
+
+# THEMES
+from . theme_manager import ThemeManager, themeManager
+from . theme_watcher import ThemeWatcher
+
+# ICONS
+from . icon_cache import IconCache, iconCache
+
+# LOG CONSOLE
+from . log_console import LogConsole
+
+# BACKGROUND TASKS
+from . task_runner import Task, TaskCancelled, TaskRunner
+
+# ASYNCIO
+from . async_loop import QtEventLoop, asyncSlot
+
+# PERFORMANCE MONITOR
+from . perf_monitor import PerfMonitor
+
+# WINDOWS
+from . window_manager import WindowManager
+
 # IMPORT FUNCTIONS
-from . ui_functions import *
+from . ui_functions import UIFunctions
 
 # APP FUNCTIONS
-from . app_functions import *
+from . app_functions import AppFunctions
+
+# NAMES EXPORTED BY "from modules import *"
+# ///////////////////////////////////////////////////////////////
+__all__ = [
+    "Ui_MainWindow",
+    "Settings",
+    "SettingsStore", "settingsStore",
+    "ThemeManager", "themeManager", "ThemeWatcher",
+    "IconCache", "iconCache",
+    "LogConsole",
+    "Task", "TaskCancelled", "TaskRunner",
+    "QtEventLoop", "asyncSlot",
+    "PerfMonitor",
+    "WindowManager",
+    "UIFunctions",
+    "AppFunctions",
+]
+
+# LAZY ATTRIBUTES
+# Rarely used names are imported on first access. Qt classes stay
+# reachable as "modules.QSomething" for code written against the old star
+# imports ("from modules import QWidget"), PySide6 only creates the
+# classes that are actually used.
+# ///////////////////////////////////////////////////////////////
+LAZY = {
+    # TABLE MODEL
+    "ColumnTableModel": "table_model",
+    "replaceTableWidget": "table_model",
+}
+
+def __getattr__(name):
+    import importlib
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    if name in LAZY:
+        value = getattr(importlib.import_module(f".{LAZY[name]}", __name__), name)
+    else:
+        for qtModule in (QtWidgets, QtGui, QtCore):
+            value = getattr(qtModule, name, None)
+            if value is not None:
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -14,28 +14,27 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
-# ///////////////////////////////////////////////////////////////
-from main import *
+import logging
+import os
+
+log = logging.getLogger("PyDracula")
 
 # WITH ACCESS TO MAIN WINDOW WIDGETS
+# Standalone service like "UIFunctions": AppFunctions.openFile(window, path)
 # ///////////////////////////////////////////////////////////////
-class AppFunctions(MainWindow):
-    def setThemeHack(self):
-        Settings.BTN_LEFT_BOX_COLOR = "background-color: #495474;"
-        Settings.BTN_RIGHT_BOX_COLOR = "background-color: #495474;"
-        Settings.MENU_SELECTED_STYLESHEET = MENU_SELECTED_STYLESHEET = """
-        border-left: 22px solid qlineargradient(spread:pad, x1:0.034, y1:0, x2:0.216, y2:0, stop:0.499 rgba(255, 121, 198, 255), stop:0.5 rgba(85, 170, 255, 0));
-        background-color: #566388;
-        """
+class AppFunctions(object):
+    # OPEN FILE (FROM THE COMMAND LINE OR A SECOND LAUNCH)
+    # Replace with the real open work, "path" is absolute
+    # ///////////////////////////////////////////////////////////////
+    def openFile(self, path):
+        log.info(f'Open file "{path}"')
+        self.ui.titleRightInfo.setText(os.path.basename(path))
 
-        # SET MANUAL STYLES
-        self.ui.lineEdit.setStyleSheet("background-color: #6272a4;")
-        self.ui.pushButton.setStyleSheet("background-color: #6272a4;")
-        self.ui.plainTextEdit.setStyleSheet("background-color: #6272a4;")
-        self.ui.tableWidget.setStyleSheet("QScrollBar:vertical { background: #6272a4; } QScrollBar:horizontal { background: #6272a4; }")
-        self.ui.scrollArea.setStyleSheet("QScrollBar:vertical { background: #6272a4; } QScrollBar:horizontal { background: #6272a4; }")
-        self.ui.comboBox.setStyleSheet("background-color: #6272a4;")
-        self.ui.horizontalScrollBar.setStyleSheet("background-color: #6272a4;")
-        self.ui.verticalScrollBar.setStyleSheet("background-color: #6272a4;")
-        self.ui.commandLinkButton.setStyleSheet("color: #ff79c6;")
+    # SAVE (RUNS ON A WORKER THREAD, DO NOT TOUCH WIDGETS HERE)
+    # Replace the steps below with the real save work
+    # ///////////////////////////////////////////////////////////////
+    def saveWork(task, steps = 40):
+        for step in range(steps):
+            task.sleep(0.025)
+            task.progress((step + 1) * 100 / steps, f"Saving {step + 1}/{steps}...")
+        return steps
@@ -7,11 +7,43 @@ class Settings():
     RIGHT_BOX_WIDTH = 240
     TIME_ANIMATION = 500
 
-    # BTNS LEFT AND RIGHT BOX COLORS
-    BTN_LEFT_BOX_COLOR = "background-color: rgb(44, 49, 58);"
-    BTN_RIGHT_BOX_COLOR = "background-color: #ff79c6;"
+    # REOPEN WITH THE LAST GEOMETRY, PANELS AND PAGE (SAVED IN THE SETTINGS FILE)
+    RESTORE_SESSION = True
 
-    # MENU SELECTED STYLESHEET
+    # OPEN ONE WINDOW PER MONITOR (SEE WindowManager)
+    WINDOW_PER_SCREEN = False
+
+    # PANEL ANIMATIONS: "layout" (minimumWidth) OR "snapshot" (PIXMAPS, ONE LAYOUT PASS)
+    ANIMATION_MODE = "layout"
+
+    # RESIZE WITH AN OUTLINE, LAYOUT ONLY ON RELEASE (CUSTOM GRIPS)
+    RESIZE_OUTLINE = False
+
+    # DROP SHADOW: "cached", "effect" OR "none"
+    SHADOW_MODE = "cached"
+
+    # WIDGETS PAGE TABLE AS A QTableView ON A "ColumnTableModel" ("window.tableModel")
+    TABLE_MODEL = False
+
+    # LOG CONSOLE (plainTextEdit ON THE WIDGETS PAGE)
+    LOG_CONSOLE_LINES = 5000
+
+    # PERFORMANCE HUD VISIBLE (TOGGLED BY "btn_hud", SAVED IN THE SETTINGS FILE)
+    PERF_HUD = False
+
+    # PERFORMANCE LOG (JSON LINES, ONE SUMMARY PER SECOND), "None" TO DISABLE
+    PERF_LOG_FILE = None
+
+    # DEFAULT THEME (APPLIED BY "setupUi")
+    DEFAULT_THEME = "themes/py_dracula_dark.qss"
+
+    # RELOAD THE THEME WHEN ITS FILE CHANGES (OR SET "PYDRACULA_THEME_RELOAD=1")
+    THEME_HOT_RELOAD = False
+
+    # BUILD LAZY PAGES WHEN THE EVENT LOOP IS IDLE
+    PREBUILD_PAGES = True
+
+    # MENU SELECTED STYLESHEET (LEGACY "UIFunctions.selectMenu", THEMES STYLE [selected="true"])
     MENU_SELECTED_STYLESHEET = """
     border-left: 22px solid qlineargradient(spread:pad, x1:0.034, y1:0, x2:0.216, y2:0, stop:0.499 rgba(255, 121, 198, 255), stop:0.5 rgba(85, 170, 255, 0));
     background-color: rgb(40, 44, 52);
@@ -0,0 +1,154 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import asyncio
+import functools
+import logging
+import selectors
+import threading
+
+from PySide6.QtCore import QCoreApplication, QObject, QSocketNotifier, Qt, QTimer
+
+log = logging.getLogger(__name__)
+
+# NON-BLOCKING SELECTOR
+# asyncio never waits inside "select", Qt does the waiting. A
+# QSocketNotifier on the epoll/kqueue descriptor wakes the loop when any
+# registered socket or pipe is ready.
+# ///////////////////////////////////////////////////////////////
+class QtSelector(selectors.DefaultSelector):
+    def select(self, timeout = None):
+        return selectors.DefaultSelector.select(self, 0)
+
+# QT DRIVEN ASYNCIO LOOP
+# A SelectorEventLoop that runs one iteration per Qt wake up (ready
+# callbacks, a due timer or socket activity), so coroutines run on the
+# GUI thread between Qt events. "run_forever" runs "app.exec()" and
+# returns its exit code; "stop" quits the application.
+# ///////////////////////////////////////////////////////////////
+class QtEventLoop(asyncio.SelectorEventLoop):
+    def __init__(self, app = None):
+        self.app = app or QCoreApplication.instance()
+        self.waking = False
+        self.driver = QObject()
+
+        # TIMER FOR THE NEXT ITERATION
+        self.timer = QTimer(self.driver)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        selector = QtSelector()
+        asyncio.SelectorEventLoop.__init__(self, selector)
+
+        # I/O READINESS (WITHOUT A POLLABLE SELECTOR, E.G. "select" ON
+        # WINDOWS, THE LOOP POLLS WHILE SOCKETS ARE REGISTERED)
+        self.notifier = None
+        try:
+            fileno = selector.fileno()
+        except (AttributeError, NotImplementedError):
+            fileno = -1
+        if fileno >= 0:
+            self.notifier = QSocketNotifier(fileno, QSocketNotifier.Read, self.driver)
+            self.notifier.activated.connect(self.tick)
+
+    # RUN
+    # ///////////////////////////////////////////////////////////////
+    def run_forever(self):
+        self._check_closed()
+        self._thread_id = threading.get_ident()
+        oldLoop = asyncio.events._get_running_loop()
+        asyncio.events._set_running_loop(self)
+        try:
+            self.wakeup()
+            return self.app.exec()
+        finally:
+            asyncio.events._set_running_loop(oldLoop)
+            self._thread_id = None
+
+    def stop(self):
+        self.app.quit()
+
+    def close(self):
+        self.timer.stop()
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+        asyncio.SelectorEventLoop.close(self)
+
+    # SCHEDULE AN ITERATION
+    # ///////////////////////////////////////////////////////////////
+    def call_soon(self, callback, *args, context = None):
+        handle = asyncio.SelectorEventLoop.call_soon(self, callback, *args, context=context)
+        self.wakeup()
+        return handle
+
+    def call_at(self, when, callback, *args, context = None):
+        handle = asyncio.SelectorEventLoop.call_at(self, when, callback, *args, context=context)
+        self.wakeup()
+        return handle
+
+    def wakeup(self):
+        # ONE PENDING TIMER IS ENOUGH, "tick" RESCHEDULES ITSELF
+        if self.waking or self.is_closed():
+            return
+        if self._ready:
+            delay = 0
+        elif self._scheduled:
+            delay = max(0, int((self._scheduled[0]._when - self.time()) * 1000))
+        elif self.notifier is None and self._selector.get_map():
+            delay = 1
+        else:
+            return
+        if self.timer.isActive() and self.timer.remainingTime() <= delay:
+            return
+        self.timer.start(delay)
+
+    # ONE ASYNCIO ITERATION
+    # ///////////////////////////////////////////////////////////////
+    def tick(self, *args):
+        if self.is_closed():
+            return
+        self.timer.stop()
+        oldLoop = asyncio.events._get_running_loop()
+        oldThread = self._thread_id
+        asyncio.events._set_running_loop(self)
+        self._thread_id = threading.get_ident()
+        self.waking = True
+        try:
+            self._run_once()
+        finally:
+            self.waking = False
+            self._thread_id = oldThread
+            asyncio.events._set_running_loop(oldLoop)
+        self.wakeup()
+
+# ASYNC SLOT
+# Lets an "async def" be connected to a Qt signal. Each emission starts a
+# task on the running loop, errors are logged instead of lost. The body
+# runs after the signal returns, so "self.sender()" is not available,
+# pass the sender as an argument instead.
+# ///////////////////////////////////////////////////////////////
+def asyncSlot(func):
+    @functools.wraps(func)
+    def slot(*args):
+        task = asyncio.ensure_future(func(*args))
+        task.add_done_callback(slotDone)
+        return task
+    return slot
+
+def slotDone(task):
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Async slot failed", exc_info=task.exception())
@@ -0,0 +1,254 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import hashlib
+import json
+import os
+import weakref
+
+from PySide6.QtCore import QPointF, QRect, QRectF, QSize, QStandardPaths, Qt
+from PySide6.QtGui import QIcon, QIconEngine, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QApplication, QStyleOption
+
+from . resources_loader import buildPaths
+
+# ICON ATLAS
+# Build "icons_atlas.png" / "icons_atlas.json" with: python build_resources.py
+# ///////////////////////////////////////////////////////////////
+ATLAS_FILE = "icons_atlas.png"
+ICON_RESOURCE = ":/icons/images/icons/{}.png"
+
+# VECTOR SOURCES
+# "images/svg/<name>.svg" replaces the PNG of the same name. Draw it on the
+# PNG's grid (same width/height) so the icon keeps its size in the layout.
+# Change CACHE_VERSION when the renderer output changes.
+# ///////////////////////////////////////////////////////////////
+SVG_FILE = os.path.join("images", "svg", "{}.svg")
+CACHE_VERSION = b"1"
+
+def cacheDir():
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    return os.path.join(base, "PyDracula", "icons") if base else None
+
+# ICON ENGINE
+# Asks the cache for a raster at the device pixel size of every paint
+# (size x devicePixelRatio), so icons stay sharp at 125%, 150%, 200%...
+# Icons are never drawn bigger than their natural size, like PNG icons.
+# ///////////////////////////////////////////////////////////////
+class CachedIconEngine(QIconEngine):
+    def __init__(self, cache, name):
+        QIconEngine.__init__(self)
+        # WEAK: THE CACHE KEEPS ITS ICONS, A CYCLE WOULD KEEP PIXMAPS ALIVE
+        # UNTIL A GARBAGE COLLECTION, POSSIBLY AFTER THE QApplication
+        self.cacheRef = weakref.ref(cache)
+        self.name = name
+
+    def actualSize(self, size, mode, state):
+        cache = self.cacheRef()
+        natural = cache.naturalSize(self.name) if cache is not None else QSize()
+        if natural.width() <= size.width() and natural.height() <= size.height():
+            return natural
+        return natural.scaled(size, Qt.KeepAspectRatio)
+
+    # SMALLER ICONS ARE CENTERED ON A CANVAS OF THE REQUESTED SIZE, OTHERWISE
+    # QIcon LOWERS THE PIXMAP'S devicePixelRatio AND THE ICON IS UPSCALED
+    def scaledPixmap(self, size, mode, state, scale):
+        cache = self.cacheRef()
+        if cache is None:
+            return QPixmap()
+        actual = self.actualSize(size, mode, state)
+        if actual == size:
+            return cache.render(self.name, size, scale, mode)
+        return cache.render(self.name, actual, scale, mode, canvas = size)
+
+    def pixmap(self, size, mode, state):
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def paint(self, painter, rect, mode, state):
+        pixmap = self.scaledPixmap(rect.size(), mode, state, painter.device().devicePixelRatioF())
+        size = pixmap.deviceIndependentSize().toSize()
+        painter.drawPixmap(rect.x() + (rect.width() - size.width()) // 2, rect.y() + (rect.height() - size.height()) // 2, pixmap)
+
+    def isNull(self):
+        return self.actualSize(QSize(1 << 16, 1 << 16), QIcon.Normal, QIcon.Off).isEmpty()
+
+    def clone(self):
+        return CachedIconEngine(self.cacheRef(), self.name)
+
+# ICON CACHE
+# Icons by name ("cil-link", "icon_close"...), one shared QIcon each.
+# Rasters are made once per size, device pixel ratio and mode:
+# - from "images/svg/<name>.svg" when it exists; these renders are also
+#   cached on disk (by content hash), later runs only read a small PNG.
+# - otherwise cut from the atlas (decoded once, on the first request) or
+#   read from the resources, then smoothly scaled for devicePixelRatio > 1.
+# ///////////////////////////////////////////////////////////////
+class IconCache():
+    def __init__(self, atlasFile=ATLAS_FILE, cachePath=None):
+        self.atlasFile = atlasFile
+        self.cachePath = cachePath or cacheDir()
+        self.atlas = None
+        self.rects = None
+        self.pixmaps = {}
+        self.icons = {}
+
+        # NAME -> (SVG BYTES, HASH) OR None
+        self.sources = {}
+        # (NAME, WIDTH, HEIGHT, SCALE, MODE, CANVAS) -> QPixmap
+        self.rasters = {}
+
+    # LOAD ATLAS (FIRST REQUEST ONLY, NEEDS A QGuiApplication)
+    # ///////////////////////////////////////////////////////////////
+    def loadAtlas(self):
+        self.rects = {}
+        for path in buildPaths(self.atlasFile):
+            index = os.path.splitext(path)[0] + ".json"
+            if not (os.path.isfile(path) and os.path.isfile(index)):
+                continue
+            atlas = QPixmap(path)
+            if atlas.isNull():
+                continue
+            try:
+                with open(index, encoding="utf-8") as f:
+                    self.rects = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.atlas = atlas
+            break
+        return self.atlas is not None
+
+    # PIXMAP (NATURAL SIZE, 1x) / ICON BY NAME
+    # ///////////////////////////////////////////////////////////////
+    def pixmap(self, name):
+        pixmap = self.pixmaps.get(name)
+        if pixmap is None:
+            if self.rects is None:
+                self.loadAtlas()
+            rect = self.rects.get(name)
+            if rect is not None:
+                pixmap = self.atlas.copy(QRect(*rect))
+            else:
+                pixmap = QPixmap(ICON_RESOURCE.format(name))
+            self.pixmaps[name] = pixmap
+        return pixmap
+
+    def icon(self, name):
+        icon = self.icons.get(name)
+        if icon is None:
+            icon = self.icons[name] = QIcon(CachedIconEngine(self, name))
+        return icon
+
+    def naturalSize(self, name):
+        if self.rects is None:
+            self.loadAtlas()
+        rect = self.rects.get(name)
+        if rect is not None:
+            return QSize(rect[2], rect[3])
+        size = self.pixmap(name).size()
+        if size.isEmpty() and self.source(name):
+            from PySide6.QtSvg import QSvgRenderer
+            size = QSvgRenderer(self.source(name)[0]).defaultSize()
+        return size
+
+    # RASTER FOR "size" (LOGICAL PIXELS) AT "scale" DEVICE PIXELS PER PIXEL
+    # ///////////////////////////////////////////////////////////////
+    def render(self, name, size, scale = 1.0, mode = QIcon.Normal, canvas = None):
+        if mode != QIcon.Disabled:
+            mode = QIcon.Normal
+        key = (name, size.width(), size.height(), scale, mode, canvas and (canvas.width(), canvas.height()))
+        pixmap = self.rasters.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        if canvas is not None:
+            icon = self.render(name, size, scale, mode)
+            pixmap = QPixmap(max(1, round(canvas.width() * scale)), max(1, round(canvas.height() * scale)))
+            pixmap.fill(Qt.transparent)
+            pixmap.setDevicePixelRatio(scale)
+            # WHOLE DEVICE PIXELS, A HALF PIXEL OFFSET WOULD BLUR THE ICON
+            offset = QPointF((pixmap.width() - icon.width()) // 2 / scale, (pixmap.height() - icon.height()) // 2 / scale)
+            painter = QPainter(pixmap)
+            painter.drawPixmap(offset, icon)
+            painter.end()
+        elif mode == QIcon.Disabled:
+            pixmap = QApplication.style().generatedIconPixmap(mode, self.render(name, size, scale), QStyleOption())
+        else:
+            width, height = max(1, round(size.width() * scale)), max(1, round(size.height() * scale))
+            source = self.source(name)
+            if source is not None:
+                pixmap = self.renderSvg(source, width, height)
+            else:
+                pixmap = self.pixmap(name)
+                if (pixmap.width(), pixmap.height()) != (width, height):
+                    pixmap = pixmap.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                else:
+                    pixmap = QPixmap(pixmap)
+            pixmap.setDevicePixelRatio(scale)
+        self.rasters[key] = pixmap
+        return pixmap
+
+    # SVG SOURCE (READ ONCE PER PROCESS)
+    # ///////////////////////////////////////////////////////////////
+    def source(self, name):
+        if name not in self.sources:
+            self.sources[name] = None
+            for path in buildPaths(SVG_FILE.format(name)):
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                self.sources[name] = (data, hashlib.sha1(CACHE_VERSION + data).hexdigest())
+                break
+        return self.sources[name]
+
+    def renderSvg(self, source, width, height):
+        data, key = source
+        path = os.path.join(self.cachePath, f"{key}-{width}x{height}.png") if self.cachePath else None
+        if path and os.path.isfile(path):
+            pixmap = QPixmap(path)
+            if pixmap.width() == width and pixmap.height() == height:
+                return pixmap
+
+        from PySide6.QtSvg import QSvgRenderer
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        QSvgRenderer(data).render(painter, QRectF(0, 0, width, height))
+        painter.end()
+        self.writeCache(path, image)
+        return QPixmap.fromImage(image)
+
+    def writeCache(self, path, image):
+        if not path:
+            return
+        try:
+            os.makedirs(self.cachePath, exist_ok=True)
+            if image.save(path + ".tmp", "PNG"):
+                os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def clear(self):
+        self.atlas = self.rects = None
+        self.pixmaps.clear()
+        self.icons.clear()
+        self.sources.clear()
+        self.rasters.clear()
+
+# SHARED INSTANCE
+# ///////////////////////////////////////////////////////////////
+iconCache = IconCache()
@@ -0,0 +1,138 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import collections
+import logging
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+
+# SIGNAL FROM ANY THREAD TO THE GUI THREAD
+# ///////////////////////////////////////////////////////////////
+class LogConsoleSignals(QObject):
+    pending = Signal()
+
+# LOG CONSOLE
+# A "logging" handler for a QPlainTextEdit. "emit" only appends the record
+# to a bounded deque, so it never waits for the GUI and records that would
+# be dropped before being shown are never formatted. Each timer tick the
+# GUI thread formats and inserts CHUNK records at a time (one edit block,
+# old lines trimmed from the top in the same block) until "budget" ms are
+# spent; what is left waits for the next tick so frames keep painting.
+# ///////////////////////////////////////////////////////////////
+class LogConsole(logging.Handler):
+    CHUNK = 200
+
+    def __init__(self, widget = None, maxLines = 5000, interval = 16, budget = 4, level = logging.NOTSET):
+        logging.Handler.__init__(self, level)
+        self.maxLines = maxLines
+        self.budget = budget / 1000
+        self.pending = collections.deque(maxlen=maxLines)
+        self.scheduled = False
+        self.widget = None
+        self.lines = 0
+
+        # FLUSH TIMER (GUI THREAD)
+        self.signals = LogConsoleSignals()
+        self.timer = QTimer(self.signals)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flushPending)
+        self.signals.pending.connect(self.timer.start)
+
+        if widget is not None:
+            self.setWidget(widget)
+
+    # SET CONSOLE WIDGET (E.G. WHEN ITS PAGE IS BUILT)
+    # ///////////////////////////////////////////////////////////////
+    def setWidget(self, widget):
+        self.widget = widget
+        widget.setReadOnly(True)
+        widget.setUndoRedoEnabled(False)
+        # LINES SHOWN, COUNTED HERE TO SPARE A DOCUMENT QUERY PER INSERT
+        self.lines = widget.blockCount() if widget.document().characterCount() > 1 else 0
+        widget.destroyed.connect(self.detach)
+        self.signals.pending.emit()
+
+    def detach(self):
+        self.widget = None
+
+    # ANY THREAD
+    # ///////////////////////////////////////////////////////////////
+    def emit(self, record):
+        # CALLED WITH "self.lock" HELD (logging.Handler.handle)
+        self.pending.append(record)
+        if not self.scheduled:
+            self.scheduled = True
+            self.signals.pending.emit()
+
+    # GUI THREAD
+    # ///////////////////////////////////////////////////////////////
+    def flushPending(self):
+        if self.widget is None:
+            return
+        end = time.perf_counter() + self.budget
+        while True:
+            self.acquire()
+            try:
+                count = min(self.CHUNK, len(self.pending))
+                records = [self.pending.popleft() for _ in range(count)]
+                if not self.pending:
+                    self.scheduled = False
+            finally:
+                self.release()
+            if records:
+                self.insertLines(self.formatRecords(records))
+            if not self.scheduled:
+                return
+            if time.perf_counter() >= end:
+                # THE REST WAITS FOR THE NEXT TICK
+                self.timer.start()
+                return
+
+    def formatRecords(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        return lines
+
+    def insertLines(self, lines):
+        if not lines:
+            return
+        scrollBar = self.widget.verticalScrollBar()
+        atBottom = scrollBar.value() == scrollBar.maximum()
+
+        cursor = self.widget.textCursor()
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.End)
+        text = "\n".join(lines)
+        cursor.insertText("\n" + text if self.lines else text)
+        self.lines += text.count("\n") + 1
+        # TRIM THE OLDEST LINES
+        extra = self.lines - self.maxLines
+        if extra > 0:
+            cursor.movePosition(QTextCursor.Start)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, extra)
+            cursor.removeSelectedText()
+            self.lines = self.maxLines
+        cursor.endEditBlock()
+
+        if atBottom:
+            scrollBar.setValue(scrollBar.maximum())
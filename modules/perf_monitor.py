@@ -0,0 +1,172 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import bisect
+import collections
+import json
+import statistics
+import time
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal
+
+# HISTOGRAM BUCKETS (UPPER EDGES IN MS, THE LAST ONE IS OPEN)
+# ///////////////////////////////////////////////////////////////
+BUCKETS = (1, 2, 4, 8, 16, 33, 50, 100)
+BUCKET_LABELS = ("1", "2", "4", "8", "16", "33", "50", "100", "+")
+
+# ROLLING SAMPLES
+# ///////////////////////////////////////////////////////////////
+class Samples():
+    def __init__(self, size):
+        self.values = collections.deque(maxlen=size)
+
+    def add(self, ms):
+        self.values.append(ms)
+
+    def histogram(self):
+        counts = [0] * (len(BUCKETS) + 1)
+        for value in self.values:
+            counts[bisect.bisect_left(BUCKETS, value)] += 1
+        return counts
+
+    def summary(self):
+        if not self.values:
+            return {"count": 0, "median": 0.0, "p95": 0.0, "max": 0.0, "histogram": self.histogram()}
+        values = sorted(self.values)
+        return {
+            "count": len(values),
+            "median": statistics.median(values),
+            "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+            "max": values[-1],
+            "histogram": self.histogram(),
+        }
+
+# PERFORMANCE MONITOR
+# - Event loop lag: how late a precise heartbeat timer fires.
+# - Frame time: time spent handling each UpdateRequest of the window,
+#   i.e. painting "bgApp" and everything on top of it.
+# "updated" fires a few times per second for the HUD; "startFile" writes
+# the same summary as JSON lines for headless/production runs.
+# ///////////////////////////////////////////////////////////////
+class PerfMonitor(QObject):
+    updated = Signal(dict)
+
+    def __init__(self, window, interval = 16, samples = 600, reportInterval = 250):
+        QObject.__init__(self, window)
+        self.window = window
+        self.interval = interval
+        self.lag = Samples(samples)
+        self.frames = Samples(samples)
+        self.frameTimes = collections.deque(maxlen=samples)
+        self.expected = None
+        self.file = None
+        self.users = set()
+
+        # HEARTBEAT
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.PreciseTimer)
+        self.heartbeat.setInterval(interval)
+        self.heartbeat.timeout.connect(self.beat)
+
+        # REPORTS (HUD / FILE)
+        self.reporter = QTimer(self)
+        self.reporter.setInterval(reportInterval)
+        self.reporter.timeout.connect(self.report)
+        self.fileTimer = QTimer(self)
+        self.fileTimer.timeout.connect(self.writeFile)
+
+    # START / STOP (SHARED BY THE HUD AND THE FILE WRITER)
+    # ///////////////////////////////////////////////////////////////
+    def acquire(self, user):
+        if not self.users:
+            self.expected = time.perf_counter() + self.interval / 1000
+            self.heartbeat.start()
+            self.window.installEventFilter(self)
+        self.users.add(user)
+
+    def release(self, user):
+        self.users.discard(user)
+        if not self.users:
+            self.heartbeat.stop()
+            self.window.removeEventFilter(self)
+
+    def isRunning(self):
+        return bool(self.users)
+
+    # HUD UPDATES
+    def startReports(self):
+        self.acquire("reports")
+        self.reporter.start()
+
+    def stopReports(self):
+        self.reporter.stop()
+        self.release("reports")
+
+    # HEADLESS MODE
+    def startFile(self, path, interval = 1000):
+        self.file = open(path, "a", encoding="utf-8")
+        self.acquire("file")
+        self.fileTimer.start(interval)
+
+    def stopFile(self):
+        if self.file is None:
+            return
+        self.fileTimer.stop()
+        self.writeFile()
+        self.file.close()
+        self.file = None
+        self.release("file")
+
+    # SAMPLES
+    # ///////////////////////////////////////////////////////////////
+    def beat(self):
+        now = time.perf_counter()
+        self.lag.add(max(0.0, now - self.expected) * 1000)
+        self.expected = now + self.interval / 1000
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.UpdateRequest:
+            start = time.perf_counter()
+            obj.event(event)
+            end = time.perf_counter()
+            self.frames.add((end - start) * 1000)
+            self.frameTimes.append(end)
+            return True
+        return False
+
+    # SUMMARY
+    # ///////////////////////////////////////////////////////////////
+    def snapshot(self):
+        now = time.perf_counter()
+        recent = [t for t in self.frameTimes if now - t <= 1.0]
+        return {
+            "time": time.time(),
+            "lag_ms": self.lag.summary(),
+            "frame_ms": self.frames.summary(),
+            "fps": len(recent),
+            "buckets": BUCKET_LABELS,
+        }
+
+    def report(self):
+        self.updated.emit(self.snapshot())
+
+    def writeFile(self):
+        if self.file is None:
+            return
+        snapshot = self.snapshot()
+        del snapshot["buckets"]
+        self.file.write(json.dumps(snapshot) + "\n")
+        self.file.flush()
@@ -0,0 +1,99 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import logging
+import os
+import re
+import sys
+
+from PySide6.QtCore import QResource
+
+log = logging.getLogger(__name__)
+
+# NAMES EXPORTED BY "from . resources_loader import *"
+__all__ = ["loadResources", "buildPaths"]
+
+# RESOURCE FILES
+# Build "resources.rcc" with: python build_resources.py
+# ///////////////////////////////////////////////////////////////
+RCC_FILE = "resources.rcc"
+QRC_FILE = "resources.qrc"
+QRC_ENTRY = re.compile(r"<file[^>]*>([^<]+)</file>")
+RESOURCES_SOURCE = None
+
+# PLACES TO LOOK FOR A FILE MADE BY "build_resources.py"
+# ///////////////////////////////////////////////////////////////
+def buildPaths(fileName):
+    paths = []
+    # FROZEN APP (cx_Freeze): NEXT TO THE EXECUTABLE
+    if getattr(sys, "frozen", False):
+        paths.append(os.path.join(os.path.dirname(sys.executable), fileName))
+    # SOURCE TREE: PROJECT ROOT
+    paths.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), fileName))
+    return paths
+
+def rccPaths():
+    return buildPaths(RCC_FILE)
+
+# STALE BUILD
+# Newest modification time of "resources.qrc" and the files it lists, 0
+# without a source tree (frozen app). One stat per resource file.
+# ///////////////////////////////////////////////////////////////
+def sourcesTime(qrc):
+    try:
+        with open(qrc, "r", encoding="utf-8") as f:
+            entries = QRC_ENTRY.findall(f.read())
+        newest = os.path.getmtime(qrc)
+    except OSError:
+        return 0
+    folder = os.path.dirname(qrc)
+    for entry in entries:
+        try:
+            newest = max(newest, os.path.getmtime(os.path.join(folder, entry.strip())))
+        except OSError:
+            pass
+    return newest
+
+# A STALE ".rcc" IS SKIPPED WHEN "resources_rc.py" IS NEWER, AND REPORTED
+def isStale(path):
+    built = os.path.getmtime(path)
+    if sourcesTime(os.path.join(os.path.dirname(path), QRC_FILE)) <= built:
+        return False
+    module = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources_rc.py")
+    fallback = os.path.isfile(module) and os.path.getmtime(module) > built
+    log.warning(f'"{path}" is older than "{QRC_FILE}" or its files, run: python build_resources.py' + (' (using "resources_rc.py")' if fallback else ""))
+    return fallback
+
+# LOAD RESOURCES
+# The ".rcc" is registered by path, so Qt memory maps it instead of
+# unmarshalling the big bytes literal in "resources_rc.py".
+# ///////////////////////////////////////////////////////////////
+def loadResources():
+    global RESOURCES_SOURCE
+    if RESOURCES_SOURCE:
+        return RESOURCES_SOURCE
+
+    for path in rccPaths():
+        if os.path.isfile(path) and not isStale(path) and QResource.registerResource(path):
+            RESOURCES_SOURCE = path
+            return RESOURCES_SOURCE
+
+    # FALLBACK: COMPILED PYTHON MODULE (REGISTERS ITSELF ON IMPORT)
+    from . import resources_rc
+    RESOURCES_SOURCE = resources_rc.__name__
+    return RESOURCES_SOURCE
+
+loadResources()
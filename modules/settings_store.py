@@ -0,0 +1,190 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import json
+import logging
+import os
+
+from PySide6.QtCore import QObject, QStandardPaths, QTimer, Signal
+
+from . task_runner import TaskRunner
+
+log = logging.getLogger(__name__)
+
+# SETTINGS FILE
+# One compact JSON object ("PYDRACULA_SETTINGS" overrides the path)
+# ///////////////////////////////////////////////////////////////
+SETTINGS_ENV = "PYDRACULA_SETTINGS"
+SAVE_DELAY = 500 # MS WITHOUT CHANGES BEFORE WRITING
+
+def settingsPath():
+    path = os.environ.get(SETTINGS_ENV)
+    if path:
+        return path
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericConfigLocation)
+    return os.path.join(base or os.path.expanduser("~"), "PyDracula", "settings.json")
+
+# WRITE ON A WORKER THREAD (ATOMIC: TEMPORARY FILE + RENAME)
+# ///////////////////////////////////////////////////////////////
+def writeSettings(task, path, text):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(path + ".tmp", path)
+    return path
+
+# SETTINGS STORE
+# The whole file is read once by "load". "set" changes the value in
+# memory, notifies ("changed" signal and "watch" callbacks) and restarts
+# a debounce timer: a burst of changes (slider, resize) is written once,
+# SAVE_DELAY after the last one, on a worker thread. "flush" writes
+# pending changes right away (on exit). Nothing is written before "load",
+# so a store that was never loaded can not overwrite the file.
+# Bound to "Settings", stored values override its class attributes of
+# the same name, which stay the defaults.
+# ///////////////////////////////////////////////////////////////
+class SettingsStore(QObject):
+    changed = Signal(str, object)
+    saved = Signal(str)
+
+    def __init__(self, path = None, delay = SAVE_DELAY, parent = None):
+        QObject.__init__(self, parent)
+        self.path = path or settingsPath()
+        self.values = {}
+        self.bound = None
+        self.watchers = {}
+        self.loaded = False
+        self.dirty = False
+        self.writes = 0
+
+        # DEBOUNCE TIMER, ONE WRITER THREAD (REPEATED SAVES COALESCE)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.save)
+        self.writer = TaskRunner(self, maxThreads=1)
+        self.writer.signals.finished.connect(lambda name, path: self.saved.emit(path))
+        self.writer.signals.failed.connect(lambda name, error: log.error(f'Can not write settings "{self.path}":\n{error}'))
+
+    # LOAD (ONE READ), MISSING OR BROKEN FILES START EMPTY
+    # ///////////////////////////////////////////////////////////////
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                values = json.loads(f.read())
+        except FileNotFoundError:
+            values = {}
+        except (OSError, ValueError) as error:
+            log.warning(f'Settings "{self.path}" ignored: {error}')
+            values = {}
+        self.values = values if isinstance(values, dict) else {}
+        self.loaded = True
+        if self.bound is not None:
+            self.bind(self.bound)
+        return self.values
+
+    # OVERRIDE "Settings" ATTRIBUTES WITH STORED VALUES
+    # A value of another type than the default (hand-edited or older file)
+    # is ignored, an int is accepted for a float.
+    def bind(self, settings):
+        self.bound = settings
+        for key, value in self.values.items():
+            if not hasattr(settings, key):
+                continue
+            default = getattr(settings, key)
+            if default is None or type(value) is type(default) or (type(default) is float and type(value) is int):
+                setattr(settings, key, value)
+            else:
+                log.warning(f'Setting "{key}" ignored: {type(value).__name__} instead of {type(default).__name__}')
+
+    # VALUES
+    # Values must be JSON types (str, int, float, bool, None, list, dict).
+    # ///////////////////////////////////////////////////////////////
+    def get(self, key, default = None):
+        if key in self.values:
+            return self.values[key]
+        return getattr(self.bound, key, default)
+
+    def set(self, key, value):
+        if self.values.get(key, self) == value:
+            return False
+        self.values[key] = value
+        if self.bound is not None and hasattr(self.bound, key):
+            setattr(self.bound, key, value)
+        self.notify(key, value)
+        self.scheduleSave()
+        return True
+
+    def remove(self, key):
+        if key not in self.values:
+            return
+        del self.values[key]
+        self.notify(key, self.get(key))
+        self.scheduleSave()
+
+    # CHANGE NOTIFICATIONS
+    # "watch" calls "callback(value)" when "key" changes. Widgets can also
+    # connect to "changed" (key, value); unwatch before they are deleted.
+    # ///////////////////////////////////////////////////////////////
+    def watch(self, key, callback):
+        self.watchers.setdefault(key, []).append(callback)
+
+    def unwatch(self, key, callback):
+        callbacks = self.watchers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def notify(self, key, value):
+        for callback in list(self.watchers.get(key, ())):
+            callback(value)
+        self.changed.emit(key, value)
+
+    # SAVE
+    # ///////////////////////////////////////////////////////////////
+    def scheduleSave(self):
+        self.dirty = True
+        if self.loaded:
+            self.timer.start()
+
+    def serialize(self):
+        return json.dumps(self.values, separators=(",", ":"), sort_keys=True)
+
+    # ASYNC: SERIALIZED HERE (SMALL), WRITTEN ON THE WORKER THREAD
+    def save(self):
+        self.timer.stop()
+        if not (self.dirty and self.loaded):
+            return
+        self.dirty = False
+        self.writes += 1
+        self.writer.submit("save", writeSettings, self.path, self.serialize())
+
+    # SYNC: PENDING CHANGES ARE ON DISK WHEN IT RETURNS
+    def flush(self):
+        self.timer.stop()
+        self.writer.waitForDone()
+        queued = self.writer.queued.pop("save", None)
+        if not ((self.dirty or queued) and self.loaded):
+            return
+        self.dirty = False
+        self.writes += 1
+        try:
+            writeSettings(None, self.path, self.serialize())
+        except OSError as error:
+            log.error(f'Can not write settings "{self.path}": {error}')
+
+# SHARED INSTANCE
+# ///////////////////////////////////////////////////////////////
+settingsStore = SettingsStore()
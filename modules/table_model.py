@@ -0,0 +1,116 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import QTableView
+
+# COLUMN TABLE MODEL
+# Data is kept as one sequence per column ("array.array", NumPy arrays or
+# any indexable sequence), a few bytes per numeric cell instead of one
+# QTableWidgetItem per cell. Text is only formatted in "data()", so only
+# rows the view paints are ever converted.
+# ///////////////////////////////////////////////////////////////
+class ColumnTableModel(QAbstractTableModel):
+    def __init__(self, columns = (), headers = None, formats = None, parent = None):
+        QAbstractTableModel.__init__(self, parent)
+        self.columns = []
+        self.headers = []
+        self.formats = []
+        self.rows = 0
+        self.setColumns(columns, headers, formats)
+
+    # REPLACE ALL COLUMNS AT ONCE
+    # "formats" are format strings ("{:.2f}") or callables, one per column.
+    # ///////////////////////////////////////////////////////////////
+    def setColumns(self, columns, headers = None, formats = None):
+        columns = list(columns)
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"columns must have the same length, got {sorted(lengths)}")
+
+        self.beginResetModel()
+        self.columns = columns
+        self.rows = lengths.pop() if lengths else 0
+        self.headers = list(headers) if headers is not None else [str(i) for i in range(len(columns))]
+        self.formats = list(formats) if formats is not None else [None] * len(columns)
+        self.endResetModel()
+
+    # QAbstractTableModel
+    # ///////////////////////////////////////////////////////////////
+    def rowCount(self, parent = QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent = QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self.columns[index.column()][index.row()]
+        fmt = self.formats[index.column()]
+        if fmt is None:
+            return str(value)
+        if callable(fmt):
+            return fmt(value)
+        return fmt.format(value)
+
+    def headerData(self, section, orientation, role = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+# TABLE VIEW WITH THE SETTINGS OF AN EXISTING QTableWidget
+# Takes its place in the layout, so the model plugs into the same view,
+# header and theme settings ("QTableView" selectors match both).
+# ///////////////////////////////////////////////////////////////
+def replaceTableWidget(tableWidget, model):
+    view = QTableView(tableWidget.parentWidget())
+    view.setObjectName(tableWidget.objectName())
+    view.setSizePolicy(tableWidget.sizePolicy())
+    view.setPalette(tableWidget.palette())
+    view.setStyleSheet(tableWidget.styleSheet())
+    view.setFrameShape(tableWidget.frameShape())
+    view.setVerticalScrollBarPolicy(tableWidget.verticalScrollBarPolicy())
+    view.setHorizontalScrollBarPolicy(tableWidget.horizontalScrollBarPolicy())
+    view.setSizeAdjustPolicy(tableWidget.sizeAdjustPolicy())
+    view.setEditTriggers(tableWidget.editTriggers())
+    view.setSelectionMode(tableWidget.selectionMode())
+    view.setSelectionBehavior(tableWidget.selectionBehavior())
+    view.setShowGrid(tableWidget.showGrid())
+    view.setGridStyle(tableWidget.gridStyle())
+
+    # HEADERS
+    # The vertical header never stretches its last section: with many rows
+    # that walks every section on each resize.
+    for source, target in ((tableWidget.horizontalHeader(), view.horizontalHeader()), (tableWidget.verticalHeader(), view.verticalHeader())):
+        target.setVisible(not source.isHidden())
+        target.setCascadingSectionResizes(source.cascadingSectionResizes())
+        target.setDefaultSectionSize(source.defaultSectionSize())
+        target.setHighlightSections(source.highlightSections())
+        if source.count():
+            target.setSectionResizeMode(source.sectionResizeMode(0))
+    view.horizontalHeader().setStretchLastSection(tableWidget.horizontalHeader().stretchLastSection())
+    view.setModel(model)
+
+    # SWAP IN LAYOUT
+    layout = tableWidget.parentWidget().layout()
+    if layout is not None:
+        layout.replaceWidget(tableWidget, view)
+    tableWidget.hide()
+    tableWidget.deleteLater()
+    return view
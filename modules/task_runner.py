@@ -0,0 +1,142 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# RAISED INSIDE A TASK WHEN IT WAS CANCELLED
+# ///////////////////////////////////////////////////////////////
+class TaskCancelled(Exception):
+    pass
+
+# SIGNALS (EMITTED FROM WORKER THREADS, QUEUED TO THE GUI THREAD)
+# ///////////////////////////////////////////////////////////////
+class TaskSignals(QObject):
+    started = Signal(str)
+    progress = Signal(str, int, str)
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+    cancelled = Signal(str)
+
+# TASK
+# Handed to the task function as its first argument. The function reports
+# with "progress(value, text)" and checks "isCancelled()" or
+# "checkCancelled()" between steps; "sleep()" wakes up on cancel.
+# ///////////////////////////////////////////////////////////////
+class Task(QRunnable):
+    def __init__(self, name, func, args, kwargs, signals, progressInterval = 0.05):
+        QRunnable.__init__(self)
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.progressInterval = progressInterval
+        self.cancelEvent = threading.Event()
+        self.lastValue = None
+        self.lastProgress = 0.0
+
+    def cancel(self):
+        self.cancelEvent.set()
+
+    def isCancelled(self):
+        return self.cancelEvent.is_set()
+
+    def checkCancelled(self):
+        if self.cancelEvent.is_set():
+            raise TaskCancelled(self.name)
+
+    def sleep(self, seconds):
+        if self.cancelEvent.wait(seconds):
+            raise TaskCancelled(self.name)
+
+    # ONLY POST WHEN THE VALUE CHANGES, AT MOST ONCE PER INTERVAL
+    def progress(self, value, text = ""):
+        value = int(value)
+        now = time.monotonic()
+        if value == self.lastValue or (value < 100 and now - self.lastProgress < self.progressInterval):
+            return
+        self.lastValue = value
+        self.lastProgress = now
+        self.signals.progress.emit(self.name, value, text)
+
+    def run(self):
+        self.signals.started.emit(self.name)
+        try:
+            result = self.func(self, *self.args, **self.kwargs)
+            self.checkCancelled()
+        except TaskCancelled:
+            self.signals.cancelled.emit(self.name)
+        except Exception:
+            self.signals.failed.emit(self.name, traceback.format_exc())
+        else:
+            self.signals.finished.emit(self.name, result)
+
+# TASK RUNNER
+# One task per name runs at a time. Submitting a name that is already
+# running does not start a second copy, the latest arguments are kept and
+# run once when the current task ends, so repeated clicks coalesce.
+# ///////////////////////////////////////////////////////////////
+class TaskRunner(QObject):
+    def __init__(self, parent = None, maxThreads = None):
+        QObject.__init__(self, parent)
+        self.pool = QThreadPool(self)
+        if maxThreads:
+            self.pool.setMaxThreadCount(maxThreads)
+        self.signals = TaskSignals(self)
+        self.running = {}
+        self.queued = {}
+
+        # CLEAN UP ON THE GUI THREAD, BEFORE USER SLOTS CONNECTED LATER
+        self.signals.finished.connect(self.taskEnded)
+        self.signals.failed.connect(self.taskEnded)
+        self.signals.cancelled.connect(self.taskEnded)
+
+    # START OR COALESCE
+    # ///////////////////////////////////////////////////////////////
+    def submit(self, name, func, *args, **kwargs):
+        if name in self.running:
+            self.queued[name] = (func, args, kwargs)
+            return False
+        task = Task(name, func, args, kwargs, self.signals)
+        self.running[name] = task
+        self.pool.start(task)
+        return True
+
+    def cancel(self, name):
+        self.queued.pop(name, None)
+        task = self.running.get(name)
+        if task is not None:
+            task.cancel()
+
+    def cancelAll(self):
+        for name in list(self.running):
+            self.cancel(name)
+
+    def isRunning(self, name):
+        return name in self.running
+
+    def waitForDone(self, msecs = -1):
+        return self.pool.waitForDone(msecs)
+
+    def taskEnded(self, name, *args):
+        self.running.pop(name, None)
+        if name in self.queued:
+            func, args, kwargs = self.queued.pop(name)
+            self.submit(name, func, *args, **kwargs)
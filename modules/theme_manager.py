@@ -0,0 +1,171 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import hashlib
+import os
+import re
+import sys
+
+from PySide6.QtCore import QStandardPaths
+
+# CACHE VERSION
+# Change when "minifyStyleSheet" output changes to drop old cache files
+# ///////////////////////////////////////////////////////////////
+CACHE_VERSION = b"1"
+CACHE_FILE_V1 = re.compile(r"[0-9a-f]{40}\.qss")
+
+# MINIFY QSS
+# Quoted strings ("Segoe UI") are kept as they are.
+# ///////////////////////////////////////////////////////////////
+STRINGS_OR_COMMENTS = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|/\*.*?\*/', re.S)
+STRINGS = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')')
+SPACES = re.compile(r"\s+")
+PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+COLON = re.compile(r":\s+")
+
+def minifyStyleSheet(qss):
+    # REMOVE COMMENTS
+    qss = STRINGS_OR_COMMENTS.sub(lambda m: m.group(1) or " ", qss)
+
+    # COLLAPSE WHITESPACE OUTSIDE STRINGS
+    chunks = STRINGS.split(qss)
+    for i in range(0, len(chunks), 2):
+        chunk = SPACES.sub(" ", chunks[i])
+        chunk = PUNCTUATION.sub(r"\1", chunk)
+        chunks[i] = COLON.sub(":", chunk)
+    return "".join(chunks).replace(";}", "}").strip()
+
+# THEME FILES
+# Accepts "themes/file.qss", "themes\file.qss" or absolute paths.
+# ///////////////////////////////////////////////////////////////
+def themePath(file):
+    file = file.replace("\\", os.sep).replace("/", os.sep)
+    if os.path.isabs(file):
+        return file
+
+    roots = []
+    # FROZEN APP (cx_Freeze): NEXT TO THE EXECUTABLE
+    if getattr(sys, "frozen", False):
+        roots.append(os.path.dirname(sys.executable))
+    # SOURCE TREE: PROJECT ROOT
+    roots.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    for root in roots:
+        path = os.path.join(root, file)
+        if os.path.isfile(path):
+            return path
+    return os.path.abspath(file)
+
+def cacheDir():
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    return os.path.join(base, "PyDracula", "themes") if base else None
+
+class ThemeManager():
+    def __init__(self, cachePath=None):
+        self.cachePath = cachePath or cacheDir()
+
+        # PATH -> (FILE STAMP, HASH, MINIFIED QSS)
+        self.compiled = {}
+
+    # LOAD THEME
+    # Returns (hash, stylesheet). The file is only read again when its
+    # size or modification time changes; minified output is cached on
+    # disk by content hash.
+    # ///////////////////////////////////////////////////////////////
+    def load(self, file):
+        path = themePath(file)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self.compiled.get(path)
+        if entry and entry[0] == stamp:
+            return entry[1], entry[2]
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        key = hashlib.sha1(CACHE_VERSION + raw).hexdigest()
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        qss = self.readCache(name, key)
+        if qss is None:
+            qss = minifyStyleSheet(raw.decode("utf-8"))
+            self.writeCache(name, key, qss)
+
+        self.compiled[path] = (stamp, key, qss)
+        return key, qss
+
+    # APPLY THEME
+    # Skips "setStyleSheet" when the widget already has this theme.
+    # "widget.themeFile" is the applied file (see ThemeWatcher).
+    # ///////////////////////////////////////////////////////////////
+    def apply(self, widget, file):
+        key, qss = self.load(file)
+        widget.themeFile = file
+        if getattr(widget, "themeHash", None) == key:
+            return False
+        widget.setStyleSheet(qss)
+        widget.themeHash = key
+        return True
+
+    # DISK CACHE
+    # One "<theme name>.<hash>.qss" file per theme: writing a new version
+    # (e.g. on every save while editing with ThemeWatcher) removes the
+    # older ones of the same name.
+    # ///////////////////////////////////////////////////////////////
+    def cacheFile(self, name, key):
+        return os.path.join(self.cachePath, f"{name}.{key}.qss")
+
+    def readCache(self, name, key):
+        if not self.cachePath:
+            return None
+        try:
+            with open(self.cacheFile(name, key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def writeCache(self, name, key, qss):
+        if not self.cachePath:
+            return
+        path = self.cacheFile(name, key)
+        try:
+            os.makedirs(self.cachePath, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(qss)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            return
+        self.pruneCache(name, key)
+
+    def pruneCache(self, name, key):
+        try:
+            files = os.listdir(self.cachePath)
+        except OSError:
+            return
+        keep = os.path.basename(self.cacheFile(name, key))
+        for file in files:
+            stem, dot, rest = file.rpartition(".")
+            # OLDER VERSIONS OF THIS THEME, AND FILES OF THE OLD "<hash>.qss" LAYOUT
+            old = stem.rpartition(".")[0] == name or CACHE_FILE_V1.fullmatch(file)
+            if old and file != keep and rest == "qss":
+                try:
+                    os.remove(os.path.join(self.cachePath, file))
+                except OSError:
+                    pass
+
+# SHARED INSTANCE
+# ///////////////////////////////////////////////////////////////
+themeManager = ThemeManager()
@@ -0,0 +1,306 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import logging
+import os
+import re
+
+import shiboken6
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+from PySide6.QtWidgets import QWidget
+
+from . theme_manager import themeManager, themePath
+
+log = logging.getLogger(__name__)
+
+# QSS RULES
+# Minified QSS (see "minifyStyleSheet") as {selector: {property: value}},
+# one entry per selector of a selector list ("a, b {...}").
+# ///////////////////////////////////////////////////////////////
+RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+COMPOUND = re.compile(r"[^\s>+~]+")
+NAME = re.compile(r"(\*|[.#]?-?[A-Za-z_][\w-]*)")
+
+def parseRules(qss):
+    rules = {}
+    for selectors, body in RULE.findall(qss):
+        declarations = {}
+        for declaration in body.split(";"):
+            name, colon, value = declaration.partition(":")
+            if colon:
+                declarations[name.strip()] = value.strip()
+        for selector in selectors.split(","):
+            rules.setdefault(selector.strip(), {}).update(declarations)
+    return rules
+
+# CHANGED SELECTORS, OR None WHEN ONLY A FULL APPLY IS CORRECT: A REMOVED
+# RULE OR PROPERTY WOULD STILL BE SET BY THE OLD THEME ON THE ROOT WIDGET
+def diffRules(old, new):
+    changed = set()
+    for selector, declarations in old.items():
+        if selector not in new or not set(declarations) <= set(new[selector]):
+            return None
+        if new[selector] != declarations:
+            changed.add(selector)
+    changed.update(selector for selector in new if selector not in old)
+    return changed
+
+# SELECTOR MATCHING
+# Over-approximates on purpose (pseudo-states, sub-controls and property
+# conditions are ignored, ">" is a descendant): a widget matched by
+# mistake is only re-polished, never styled wrong.
+# ///////////////////////////////////////////////////////////////
+def compoundMatches(compound, widget):
+    for name in NAME.findall(compound.split(":", 1)[0].split("[", 1)[0]):
+        if name == "*":
+            continue
+        if name[0] == "#":
+            if widget.objectName() != name[1:]:
+                return False
+        elif name[0] == ".":
+            if widget.metaObject().className() != name[1:]:
+                return False
+        elif not widget.inherits(name):
+            return False
+    return True
+
+def selectorMatches(selector, widget):
+    compounds = COMPOUND.findall(selector)
+    if not compounds or not compoundMatches(compounds[-1], widget):
+        return False
+    ancestor = widget.parentWidget()
+    for compound in reversed(compounds[:-1]):
+        while ancestor is not None and not compoundMatches(compound, ancestor):
+            ancestor = ancestor.parentWidget()
+        if ancestor is None:
+            return False
+        ancestor = ancestor.parentWidget()
+    return True
+
+# THEME SOURCES
+# A generated theme "themes/<base>_<variant>.qss" is compiled from the
+# template "themes/src/<base>.qss" and the palette
+# "themes/src/<base>_<variant>.json" (see build_resources.py). Returns
+# (template, palette), or None for a hand-written theme or when the
+# sources are not shipped (frozen app).
+# ///////////////////////////////////////////////////////////////
+def themeSources(path):
+    folder, file = os.path.split(path)
+    name = os.path.splitext(file)[0]
+    source = os.path.join(folder, "src")
+    palette = os.path.join(source, name + ".json")
+    base = name
+    while "_" in base:
+        base = base.rpartition("_")[0]
+        template = os.path.join(source, base + ".qss")
+        if os.path.isfile(template):
+            return (template, palette) if os.path.isfile(palette) else None
+    return None
+
+def modified(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+# THEME WATCHER
+# Watches the theme file of "root" (and its folder, editors often save by
+# replacing the file) and reloads it DELAY ms after the last change. For
+# a generated theme, its template and palette in "themes/src" are watched
+# too: saving one of them recompiles the theme ("build_resources.buildTheme")
+# before the reload, so the workflow is to edit "themes/src" with the app
+# running. A template or palette that does not compile is logged and the
+# current theme is kept.
+# Setting a style sheet re-polishes the whole subtree, so the root is not
+# touched for compatible edits: the changed rules are diffed, and the new
+# theme is set on the smallest subtrees holding the widgets they match
+# (closer style sheets win). Only those widgets are re-polished. Removed
+# rules/properties, or changes matching most of the window, fall back to
+# a full apply on the root.
+# ///////////////////////////////////////////////////////////////
+class ThemeWatcher(QObject):
+    # "unchanged", "incremental" OR "full"
+    reloaded = Signal(str)
+
+    DELAY = 150
+    # FULL APPLY WHEN THE SUBTREES TO RE-POLISH HOLD MORE THAN THIS PART OF THE WIDGETS
+    MAX_PART = 0.5
+
+    def __init__(self, root, parent = None, delay = DELAY):
+        QObject.__init__(self, parent)
+        self.root = root
+        self.file = None
+        # SELECTORS CHANGED SINCE THE LAST FULL APPLY, WIDGETS HOLDING THE NEW THEME
+        self.dirty = set()
+        self.hosts = []
+        self.repolished = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.reload)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.timer.start)
+        self.watcher.directoryChanged.connect(self.timer.start)
+        self.track(getattr(root, "themeFile", None))
+
+    # START FROM THE THEME APPLIED TO THE ROOT
+    def track(self, file):
+        self.clearHosts()
+        self.dirty.clear()
+        self.file = file
+        self.qss = themeManager.load(file)[1] if file else ""
+        self.rules = parseRules(self.qss)
+        self.watch()
+
+    def watch(self):
+        if not self.file:
+            return
+        path = themePath(self.file)
+        paths = [path, os.path.dirname(path)]
+        sources = themeSources(path)
+        if sources:
+            paths += [*sources, os.path.dirname(sources[0])]
+        for watched in paths:
+            if os.path.exists(watched) and watched not in self.watcher.files() + self.watcher.directories():
+                self.watcher.addPath(watched)
+
+    # RELOAD
+    # ///////////////////////////////////////////////////////////////
+    def reload(self):
+        file = getattr(self.root, "themeFile", self.file)
+        try:
+            if file != self.file:
+                # ANOTHER THEME WAS APPLIED ("UIFunctions.theme")
+                self.track(file)
+            if not self.file:
+                return None
+            self.watch()
+            self.compileSources()
+            qss = themeManager.load(self.file)[1]
+        except OSError:
+            # MID-SAVE, THE NEXT CHANGE SIGNAL RELOADS AGAIN
+            return None
+        if qss == self.qss:
+            return self.finish("unchanged")
+
+        rules = parseRules(qss)
+        changed = diffRules(self.rules, rules)
+        self.qss, self.rules = qss, rules
+        if changed is None:
+            return self.applyFull()
+        if not changed:
+            # COMMENTS, FORMATTING OR OVERRIDDEN DECLARATIONS ONLY
+            return self.finish("unchanged")
+        self.dirty |= changed
+        hosts = self.findHosts(self.root, self.dirty)
+        if hosts is None:
+            return self.applyFull()
+        self.applyHosts(hosts)
+        return self.finish("incremental")
+
+    # RECOMPILE A GENERATED THEME OLDER THAN ITS SOURCES
+    def compileSources(self):
+        path = themePath(self.file)
+        sources = themeSources(path)
+        if sources is None or modified(path) >= max(modified(source) for source in sources):
+            return
+        try:
+            # PROJECT ROOT, NEXT TO "main.py"
+            import build_resources
+        except ImportError:
+            return
+        try:
+            build_resources.buildTheme(*sources, os.path.dirname(path))
+        except ValueError as error:
+            # UNKNOWN TOKEN OR INVALID JSON (json.JSONDecodeError)
+            log.warning(f'Theme "{self.file}" not compiled: {error}')
+
+    def applyFull(self):
+        self.clearHosts()
+        themeManager.apply(self.root, self.file)
+        self.dirty.clear()
+        self.repolished = len(self.root.findChildren(QWidget)) + 1
+        return self.finish("full")
+
+    def finish(self, mode):
+        if mode != "unchanged":
+            log.info(f'Theme "{self.file}" reloaded ({mode}, {self.repolished} widgets re-polished)')
+        self.reloaded.emit(mode)
+        return mode
+
+    # WIDGETS BUILT AFTER AN INCREMENTAL RELOAD (E.G. LAZY PAGES) WERE
+    # POLISHED WITH THE OLD ROOT THEME, CALL THIS ONCE THEY EXIST
+    def refresh(self, widget):
+        if not self.dirty or self.insideHost(widget):
+            return
+        hosts = self.findHosts(widget, self.dirty)
+        if hosts is None:
+            self.applyFull()
+        elif hosts:
+            self.applyHosts(hosts)
+
+    # HOSTS
+    # A host gets the whole new theme as its own style sheet. Widgets with
+    # their own style sheet are hosted by their closest ancestor without
+    # one; reaching the root means a full apply (None).
+    # ///////////////////////////////////////////////////////////////
+    def findHosts(self, top, selectors):
+        widgets = [top] + top.findChildren(QWidget)
+        hosts = []
+        for widget in widgets:
+            if self.insideHost(widget) or not any(selectorMatches(selector, widget) for selector in selectors):
+                continue
+            host = widget
+            while host is not None and host is not self.root and host.styleSheet():
+                host = host.parentWidget()
+            if host is None or host is self.root:
+                return None
+            hosts.append(host)
+
+        # KEEP THE TOP-MOST HOSTS ONLY
+        unique = set(hosts)
+        hosts = [host for host in dict.fromkeys(hosts) if not any(parent in unique for parent in self.ancestors(host))]
+        covered = sum(len(host.findChildren(QWidget)) + 1 for host in hosts)
+        if covered > self.MAX_PART * (len(self.root.findChildren(QWidget)) + 1):
+            return None
+        return hosts
+
+    def applyHosts(self, hosts):
+        self.hosts = [host for host in self.hosts if shiboken6.isValid(host)]
+        self.repolished = 0
+        for host in self.hosts + [host for host in hosts if host not in self.hosts]:
+            if host not in self.hosts:
+                self.hosts.append(host)
+            host.setStyleSheet(self.qss)
+            self.repolished += len(host.findChildren(QWidget)) + 1
+
+    def clearHosts(self):
+        for host in self.hosts:
+            if shiboken6.isValid(host):
+                host.setStyleSheet("")
+        self.hosts = []
+
+    def insideHost(self, widget):
+        return any(host is widget or host in self.ancestors(widget) for host in self.hosts if shiboken6.isValid(host))
+
+    def ancestors(self, widget):
+        parents = []
+        widget = widget.parentWidget()
+        while widget is not None:
+            parents.append(widget)
+            widget = widget.parentWidget()
+        return parents
@@ -14,39 +14,69 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-# MAIN FILE
-# ///////////////////////////////////////////////////////////////
-from main import *
+from startup_trace import tracer
 
-# GLOBALS
-# ///////////////////////////////////////////////////////////////
-GLOBAL_STATE = False
-GLOBAL_TITLE_BAR = True
+from PySide6.QtCore import QByteArray, QEasingCurve, QEvent, QObject, QParallelAnimationGroup, QPropertyAnimation, Qt, QTimer
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QGraphicsDropShadowEffect, QPushButton, QSizeGrip
+
+from widgets import CustomGrip, PanelTransition, ShadowFrame
+from . app_settings import Settings
+from . icon_cache import iconCache
+from . theme_manager import themeManager
 
-class UIFunctions(MainWindow):
+# MENU BUTTONS CACHE
+# Clears "menuButtonsCache" of the window when a direct child of "topMenu"
+# is added or removed (buttons are not fully built yet on "ChildAdded",
+# so any child counts).
+# ///////////////////////////////////////////////////////////////
+class MenuButtonsWatcher(QObject):
+    def __init__(self, window):
+        QObject.__init__(self, window.ui.topMenu)
+        self.window = window
+        window.ui.topMenu.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.ChildAdded, QEvent.ChildRemoved):
+            self.window.menuButtonsCache = None
+        return False
+
+# UI FUNCTIONS
+# Standalone service, it does not import "main.py". Every function takes
+# the window it works on as first argument:
+# UIFunctions.toggleMenu(window, True)
+# ///////////////////////////////////////////////////////////////
+class UIFunctions(object):
     # MAXIMIZE/RESTORE
+    # The state belongs to each window ("self.maximized"), windows on
+    # other monitors are not affected.
     # ///////////////////////////////////////////////////////////////
     def maximize_restore(self):
-        global GLOBAL_STATE
-        status = GLOBAL_STATE
+        status = UIFunctions.returStatus(self)
         if status == False:
             self.showMaximized()
-            GLOBAL_STATE = True
+            UIFunctions.setMaximizedLayout(self, True)
+        else:
+            self.showNormal()
+            self.resize(self.width()+1, self.height()+1)
+            UIFunctions.setMaximizedLayout(self, False)
+
+    # MARGINS, BUTTON AND GRIPS OF THE MAXIMIZED/NORMAL WINDOW (NO SHOW CALLS)
+    def setMaximizedLayout(self, maximized):
+        self.maximized = maximized
+        if maximized:
             self.ui.appMargins.setContentsMargins(0, 0, 0, 0)
             self.ui.maximizeRestoreAppBtn.setToolTip("Restore")
-            self.ui.maximizeRestoreAppBtn.setIcon(QIcon(u":/icons/images/icons/icon_restore.png"))
+            self.ui.maximizeRestoreAppBtn.setIcon(iconCache.icon("icon_restore"))
             self.ui.frame_size_grip.hide()
             self.left_grip.hide()
             self.right_grip.hide()
             self.top_grip.hide()
             self.bottom_grip.hide()
         else:
-            GLOBAL_STATE = False
-            self.showNormal()
-            self.resize(self.width()+1, self.height()+1)
             self.ui.appMargins.setContentsMargins(10, 10, 10, 10)
             self.ui.maximizeRestoreAppBtn.setToolTip("Maximize")
-            self.ui.maximizeRestoreAppBtn.setIcon(QIcon(u":/icons/images/icons/icon_maximize.png"))
+            self.ui.maximizeRestoreAppBtn.setIcon(iconCache.icon("icon_maximize"))
             self.ui.frame_size_grip.show()
             self.left_grip.show()
             self.right_grip.show()
@@ -56,13 +86,12 @@ class UIFunctions(MainWindow):
     # RETURN STATUS
     # ///////////////////////////////////////////////////////////////
     def returStatus(self):
-        return GLOBAL_STATE
+        return getattr(self, "maximized", False)
 
     # SET STATUS
     # ///////////////////////////////////////////////////////////////
     def setStatus(self, status):
-        global GLOBAL_STATE
-        GLOBAL_STATE = status
+        self.maximized = status
 
     # TOGGLE MENU
     # ///////////////////////////////////////////////////////////////
@@ -80,6 +109,9 @@ class UIFunctions(MainWindow):
                 widthExtended = standard
 
             # ANIMATION
+            if Settings.ANIMATION_MODE == "snapshot":
+                UIFunctions.start_snapshot_animation(self, {self.ui.leftMenuBg: widthExtended})
+                return
             self.animation = QPropertyAnimation(self.ui.leftMenuBg, b"minimumWidth")
             self.animation.setDuration(Settings.TIME_ANIMATION)
             self.animation.setStartValue(width)
@@ -95,24 +127,19 @@ class UIFunctions(MainWindow):
             width = self.ui.extraLeftBox.width()
             widthRightBox = self.ui.extraRightBox.width()
             maxExtend = Settings.LEFT_BOX_WIDTH
-            color = Settings.BTN_LEFT_BOX_COLOR
             standard = 0
 
-            # GET BTN STYLE
-            style = self.ui.toggleLeftBox.styleSheet()
-
             # SET MAX WIDTH
             if width == 0:
                 widthExtended = maxExtend
                 # SELECT BTN
-                self.ui.toggleLeftBox.setStyleSheet(style + color)
+                UIFunctions.setStateProperty(self.ui.toggleLeftBox, "active", True)
                 if widthRightBox != 0:
-                    style = self.ui.settingsTopBtn.styleSheet()
-                    self.ui.settingsTopBtn.setStyleSheet(style.replace(Settings.BTN_RIGHT_BOX_COLOR, ''))
+                    UIFunctions.setStateProperty(self.ui.settingsTopBtn, "active", False)
             else:
                 widthExtended = standard
                 # RESET BTN
-                self.ui.toggleLeftBox.setStyleSheet(style.replace(color, ''))
+                UIFunctions.setStateProperty(self.ui.toggleLeftBox, "active", False)
                 
         UIFunctions.start_box_animation(self, width, widthRightBox, "left")
 
@@ -124,24 +151,19 @@ class UIFunctions(MainWindow):
             width = self.ui.extraRightBox.width()
             widthLeftBox = self.ui.extraLeftBox.width()
             maxExtend = Settings.RIGHT_BOX_WIDTH
-            color = Settings.BTN_RIGHT_BOX_COLOR
             standard = 0
 
-            # GET BTN STYLE
-            style = self.ui.settingsTopBtn.styleSheet()
-
             # SET MAX WIDTH
             if width == 0:
                 widthExtended = maxExtend
                 # SELECT BTN
-                self.ui.settingsTopBtn.setStyleSheet(style + color)
+                UIFunctions.setStateProperty(self.ui.settingsTopBtn, "active", True)
                 if widthLeftBox != 0:
-                    style = self.ui.toggleLeftBox.styleSheet()
-                    self.ui.toggleLeftBox.setStyleSheet(style.replace(Settings.BTN_LEFT_BOX_COLOR, ''))
+                    UIFunctions.setStateProperty(self.ui.toggleLeftBox, "active", False)
             else:
                 widthExtended = standard
                 # RESET BTN
-                self.ui.settingsTopBtn.setStyleSheet(style.replace(color, ''))
+                UIFunctions.setStateProperty(self.ui.settingsTopBtn, "active", False)
 
             UIFunctions.start_box_animation(self, widthLeftBox, width, "right")
 
@@ -160,6 +182,11 @@ class UIFunctions(MainWindow):
         else:
             right_width = 0       
 
+        # SNAPSHOT ANIMATION (NO LAYOUT PASS PER FRAME)
+        if Settings.ANIMATION_MODE == "snapshot":
+            UIFunctions.start_snapshot_animation(self, {self.ui.extraLeftBox: left_width, self.ui.extraRightBox: right_width})
+            return
+
         # ANIMATION LEFT BOX        
         self.left_box = QPropertyAnimation(self.ui.extraLeftBox, b"minimumWidth")
         self.left_box.setDuration(Settings.TIME_ANIMATION)
@@ -180,8 +207,68 @@ class UIFunctions(MainWindow):
         self.group.addAnimation(self.right_box)
         self.group.start()
 
+    # SNAPSHOT ANIMATION
+    # Commits the final widths at once and slides pixmaps of "bgApp".
+    # ///////////////////////////////////////////////////////////////
+    def start_snapshot_animation(self, panels):
+        running = getattr(self, "panelTransition", None)
+        if running is not None and running.isRunning():
+            running.finish()
+        self.panelTransition = PanelTransition(self.ui.bgApp, panels, Settings.TIME_ANIMATION, QEasingCurve.InOutQuart)
+        self.panelTransition.run()
+
     # SELECT/DESELECT MENU
+    # Selection is the "selected" dynamic property, styled by the theme with
+    # '#topMenu .QPushButton[selected="true"]'. Only buttons whose state
+    # changes are re-polished. Open box buttons use "active" the same way.
     # ///////////////////////////////////////////////////////////////
+    # SET A BOOLEAN PROPERTY USED BY THEME SELECTORS
+    def setStateProperty(widget, name, value):
+        if bool(widget.property(name)) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        widget.update()
+
+    # SET SELECTED PROPERTY
+    def setMenuSelected(widget, selected):
+        UIFunctions.setStateProperty(widget, "selected", selected)
+
+    # SELECT BUTTON AND DESELECT THE PREVIOUS ONE
+    def selectMenuButton(self, widget):
+        current = getattr(self, "selectedMenu", None)
+        if current is widget:
+            return
+        if current is not None:
+            UIFunctions.setMenuSelected(current, False)
+        UIFunctions.setMenuSelected(widget, True)
+        self.selectedMenu = widget
+
+    # MENU BUTTONS (SEARCHED AGAIN ONLY AFTER "topMenu" GAINS OR LOSES A CHILD)
+    def menuButtons(self):
+        if getattr(self, "menuButtonsCache", None) is None:
+            if getattr(self, "menuButtonsWatcher", None) is None:
+                self.menuButtonsWatcher = MenuButtonsWatcher(self)
+            self.menuButtonsCache = self.ui.topMenu.findChildren(QPushButton)
+        return self.menuButtonsCache
+
+    # START SELECTION
+    def selectStandardMenu(self, widget):
+        for w in UIFunctions.menuButtons(self):
+            if w.objectName() == widget:
+                UIFunctions.selectMenuButton(self, w)
+
+    # RESET SELECTION
+    def resetStyle(self, widget):
+        for w in UIFunctions.menuButtons(self):
+            if w.objectName() != widget:
+                UIFunctions.setMenuSelected(w, False)
+                if getattr(self, "selectedMenu", None) is w:
+                    self.selectedMenu = None
+
+    # STYLESHEET STRING SELECTION (LEGACY)
+    # Use "selectMenuButton" instead, each call forces a stylesheet parse.
     # SELECT
     def selectMenu(getStyle):
         select = getStyle + Settings.MENU_SELECTED_STYLESHEET
@@ -192,24 +279,78 @@ class UIFunctions(MainWindow):
         deselect = getStyle.replace(Settings.MENU_SELECTED_STYLESHEET, "")
         return deselect
 
-    # START SELECTION
-    def selectStandardMenu(self, widget):
-        for w in self.ui.topMenu.findChildren(QPushButton):
-            if w.objectName() == widget:
-                w.setStyleSheet(UIFunctions.selectMenu(w.styleSheet()))
-
-    # RESET SELECTION
-    def resetStyle(self, widget):
-        for w in self.ui.topMenu.findChildren(QPushButton):
-            if w.objectName() != widget:
-                w.setStyleSheet(UIFunctions.deselectMenu(w.styleSheet()))
+    # NAVIGATION
+    # Buttons are registered with their page, switching is one dict lookup.
+    # ///////////////////////////////////////////////////////////////
+    # REGISTER BUTTON AND PAGE
+    def registerPage(self, button, page):
+        if not hasattr(self, "pages"):
+            self.pages = {}
+        self.pages[button.objectName()] = (button, page)
+        if page.parent() is None:
+            self.ui.stackedWidget.addWidget(page)
+        if getattr(self, "menuButtonsCache", None) is not None and button not in self.menuButtonsCache:
+            self.menuButtonsCache.append(button)
+
+    # UNREGISTER BUTTON
+    def unregisterPage(self, button):
+        getattr(self, "pages", {}).pop(button.objectName(), None)
+
+    # SHOW PAGE OF A REGISTERED BUTTON, RETURN FALSE IF NOT REGISTERED
+    def navigate(self, name):
+        entry = getattr(self, "pages", {}).get(name)
+        if entry is None:
+            return False
+        button, page = entry
+        self.showPage(page)
+        UIFunctions.selectMenuButton(self, button)
+        return True
+
+    # SESSION
+    # Geometry, maximize state, open panels and current page, saved on
+    # close. Restored before "show": final widths are set directly (no
+    # animation), so the first show is the only layout pass.
+    # ///////////////////////////////////////////////////////////////
+    def sessionState(self):
+        current = self.ui.stackedWidget.currentWidget()
+        pages = [name for name, (button, page) in getattr(self, "pages", {}).items() if page == current]
+        return {
+            "geometry": self.saveGeometry().toBase64().data().decode("ascii"),
+            "maximized": UIFunctions.returStatus(self),
+            "menu": self.ui.leftMenuBg.minimumWidth() > 60,
+            "leftBox": self.ui.extraLeftBox.minimumWidth() > 0,
+            "rightBox": self.ui.extraRightBox.minimumWidth() > 0,
+            "page": pages[0] if pages else None,
+        }
+
+    # The settings file may be hand-edited, corrupt or from an older
+    # version: fields of the wrong type are skipped and keep the default.
+    def restoreSession(self, state):
+        if not isinstance(state, dict):
+            return False
+        geometry = state.get("geometry")
+        if isinstance(geometry, str) and geometry.isascii():
+            self.restoreGeometry(QByteArray.fromBase64(geometry.encode("ascii")))
+        if state.get("menu") is True:
+            self.ui.leftMenuBg.setMinimumWidth(Settings.MENU_WIDTH)
+        if state.get("leftBox") is True:
+            self.ui.extraLeftBox.setMinimumWidth(Settings.LEFT_BOX_WIDTH)
+            UIFunctions.setStateProperty(self.ui.toggleLeftBox, "active", True)
+        elif state.get("rightBox") is True:
+            self.ui.extraRightBox.setMinimumWidth(Settings.RIGHT_BOX_WIDTH)
+            UIFunctions.setStateProperty(self.ui.settingsTopBtn, "active", True)
+        if state.get("maximized") is True and Settings.ENABLE_CUSTOM_TITLE_BAR:
+            UIFunctions.setMaximizedLayout(self, True)
+        page = state.get("page")
+        if isinstance(page, str):
+            UIFunctions.navigate(self, page)
+        return True
 
     # IMPORT THEMES FILES QSS/CSS
     # ///////////////////////////////////////////////////////////////
     def theme(self, file, useCustomTheme):
         if useCustomTheme:
-            str = open(file, 'r').read()
-            self.ui.styleSheet.setStyleSheet(str)
+            themeManager.apply(self.ui.styleSheet, file)
 
     # START - GUI DEFINITIONS
     # ///////////////////////////////////////////////////////////////
@@ -226,9 +367,10 @@ class UIFunctions(MainWindow):
             self.setAttribute(Qt.WA_TranslucentBackground)
 
             # MOVE WINDOW / MAXIMIZE / RESTORE
+            self.maximized = False
             def moveWindow(event):
                 # IF MAXIMIZED CHANGE TO NORMAL
-                if UIFunctions.returStatus(self):
+                if self.maximized:
                     UIFunctions.maximize_restore(self)
                 # MOVE WINDOW
                 if event.buttons() == Qt.LeftButton:
@@ -238,10 +380,11 @@ class UIFunctions(MainWindow):
             self.ui.titleRightInfo.mouseMoveEvent = moveWindow
 
             # CUSTOM GRIPS
-            self.left_grip = CustomGrip(self, Qt.LeftEdge, True)
-            self.right_grip = CustomGrip(self, Qt.RightEdge, True)
-            self.top_grip = CustomGrip(self, Qt.TopEdge, True)
-            self.bottom_grip = CustomGrip(self, Qt.BottomEdge, True)
+            with tracer.phase("CustomGrip"):
+                self.left_grip = CustomGrip(self, Qt.LeftEdge, True, Settings.RESIZE_OUTLINE)
+                self.right_grip = CustomGrip(self, Qt.RightEdge, True, Settings.RESIZE_OUTLINE)
+                self.top_grip = CustomGrip(self, Qt.TopEdge, True, Settings.RESIZE_OUTLINE)
+                self.bottom_grip = CustomGrip(self, Qt.BottomEdge, True, Settings.RESIZE_OUTLINE)
 
         else:
             self.ui.appMargins.setContentsMargins(0, 0, 0, 0)
@@ -251,12 +394,17 @@ class UIFunctions(MainWindow):
             self.ui.frame_size_grip.hide()
 
         # DROP SHADOW
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(17)
-        self.shadow.setXOffset(0)
-        self.shadow.setYOffset(0)
-        self.shadow.setColor(QColor(0, 0, 0, 150))
-        self.ui.bgApp.setGraphicsEffect(self.shadow)
+        # "cached": 9-slice pixmaps painted around "bgApp" (see ShadowFrame)
+        # "effect": QGraphicsDropShadowEffect, re-blurred on every repaint
+        if Settings.SHADOW_MODE == "cached":
+            self.shadow = ShadowFrame(self.ui.styleSheet, self.ui.bgApp, 17, QColor(0, 0, 0, 150))
+        elif Settings.SHADOW_MODE == "effect":
+            self.shadow = QGraphicsDropShadowEffect(self)
+            self.shadow.setBlurRadius(17)
+            self.shadow.setXOffset(0)
+            self.shadow.setYOffset(0)
+            self.shadow.setColor(QColor(0, 0, 0, 150))
+            self.ui.bgApp.setGraphicsEffect(self.shadow)
 
         # RESIZE WINDOW
         self.sizegrip = QSizeGrip(self.ui.frame_size_grip)
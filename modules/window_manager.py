@@ -0,0 +1,90 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+import functools
+
+import shiboken6
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QGuiApplication
+from PySide6.QtWidgets import QApplication
+
+# WINDOW MANAGER
+# Owns the frameless windows of the process (e.g. one per monitor). They
+# share what is process wide: resources registered once, the theme read
+# and minified once by "themeManager", Qt's pixmap/icon cache and the
+# application icon. Everything else (widgets, maximize state, animations)
+# belongs to each window, closed windows are deleted.
+# ///////////////////////////////////////////////////////////////
+class WindowManager(QObject):
+    windowOpened = Signal(object)
+    windowClosed = Signal(object)
+
+    def __init__(self, windowClass, parent = None):
+        QObject.__init__(self, parent)
+        self.windowClass = windowClass
+        self.windows = []
+
+    # CREATE A WINDOW, CENTERED ON "screen" (DEFAULT: PRIMARY SCREEN)
+    # UNLESS ITS RESTORED SESSION ALREADY PUTS IT THERE
+    # ///////////////////////////////////////////////////////////////
+    def createWindow(self, screen = None, *args, **kwargs):
+        window = self.windowClass(*args, **kwargs)
+        window.setAttribute(Qt.WA_DeleteOnClose)
+        if screen is not None and not screen.availableGeometry().contains(window.frameGeometry().center()):
+            geometry = window.frameGeometry()
+            geometry.moveCenter(screen.availableGeometry().center())
+            window.move(geometry.topLeft())
+        window.destroyed.connect(functools.partial(self.windowDestroyed, window))
+        self.windows.append(window)
+        self.windowOpened.emit(window)
+        return window
+
+    # ONE WINDOW PER MONITOR
+    # Each one saves and restores its own session ("session" argument of
+    # the window class): "SESSION" on the primary screen, "SESSION:<screen
+    # name>" on the others, so they do not overwrite each other's geometry.
+    def openOnAllScreens(self, *args, **kwargs):
+        primary = QGuiApplication.primaryScreen()
+        return [
+            self.createWindow(screen, *args, session="SESSION" if screen is primary else f"SESSION:{screen.name()}", **kwargs)
+            for screen in QGuiApplication.screens()
+        ]
+
+    # FOCUSED WINDOW, OR THE LAST ONE OPENED ("None" WHEN ALL ARE CLOSED)
+    def activeWindow(self):
+        active = QApplication.activeWindow()
+        if active in self.windows:
+            return active
+        return self.windows[-1] if self.windows else None
+
+    def closeAll(self):
+        for window in list(self.windows):
+            window.close()
+
+    # "sender()" IS ALREADY GONE IN "destroyed", THE WINDOW IS BOUND INSTEAD.
+    # "windowClosed" RECEIVERS MUST NOT USE THE (DELETED) WINDOW'S WIDGETS
+    def windowDestroyed(self, window, *args):
+        if not shiboken6.isValid(self):
+            return
+        if window in self.windows:
+            self.windows.remove(window)
+            self.windowClosed.emit(window)
+
+    def __len__(self):
+        return len(self.windows)
+
+    def __iter__(self):
+        return iter(list(self.windows))
@@ -3,7 +3,13 @@ import os
 from cx_Freeze import setup, Executable
 
 # ADD FILES
-files = ['icon.ico','themes/']
+files = ['icon.ico','themes/','images/svg/']
+
+# BINARY RESOURCES (BUILD WITH: python build_resources.py)
+if os.path.isfile('resources.rcc'):
+    files.append('resources.rcc')
+if os.path.isfile('icons_atlas.png'):
+    files += ['icons_atlas.png', 'icons_atlas.json']
 
 # TARGET
 target = Executable(
@@ -0,0 +1,155 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SINGLE INSTANCE
+# The running app listens on a local socket (QLocalServer: a Unix domain
+# socket on Linux/macOS, a named pipe on Windows). A second launch sends its
+# arguments there and exits before importing "modules", so opening a page or
+# a file in the running window costs a Python start and QtCore/QtNetwork only.
+# Only imports QtCore and QtNetwork, so it can be imported before "modules".
+#
+# Usage: python main.py --single-instance [--page=widgets] [file ...]
+#        (or set PYDRACULA_SINGLE_INSTANCE=1)
+# ///////////////////////////////////////////////////////////////
+
+import functools
+import getpass
+import json
+import logging
+import os
+
+from PySide6.QtCore import QDir, QLockFile, QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+log = logging.getLogger(__name__)
+
+FLAG = "--single-instance"
+ENABLE_ENV = "PYDRACULA_SINGLE_INSTANCE"
+NAME_ENV = "PYDRACULA_INSTANCE_NAME"
+TIMEOUT = 500 # MS, PER STEP (CONNECT, WRITE, ANSWER)
+
+# ONE SERVER PER USER ("PYDRACULA_INSTANCE_NAME" OVERRIDES IT, E.G. IN BENCHMARKS)
+# ///////////////////////////////////////////////////////////////
+def serverName():
+    name = os.environ.get(NAME_ENV)
+    if name:
+        return name
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getpid())
+    return f"pydracula-{user}"
+
+class SingleInstance(QObject):
+    # ARGUMENTS (WITHOUT THE SCRIPT NAME) AND WORKING DIRECTORY OF THE SECOND LAUNCH
+    messageReceived = Signal(list, str)
+
+    def __init__(self, name = None):
+        QObject.__init__(self)
+        self.name = name or serverName()
+        self.enabled = False
+        self.server = None
+
+    # ENABLE FROM THE COMMAND LINE (THE FLAG IS REMOVED FROM "argv") OR ENVIRONMENT
+    # ///////////////////////////////////////////////////////////////
+    def configure(self, argv):
+        if FLAG in argv[1:]:
+            self.enabled = True
+            argv.remove(FLAG)
+        if os.environ.get(ENABLE_ENV, "").lower() in ("1", "true", "yes"):
+            self.enabled = True
+
+    # SECOND LAUNCH: SEND "argv" TO THE RUNNING INSTANCE
+    # Returns True once the running instance confirmed it, False when there
+    # is none (or it does not answer): then start normally.
+    # ///////////////////////////////////////////////////////////////
+    def forward(self, argv, timeout = TIMEOUT):
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        if not socket.waitForConnected(timeout):
+            return False
+        message = json.dumps({"argv": list(argv), "cwd": os.getcwd()})
+        socket.write(message.encode("utf-8") + b"\n")
+        if not socket.waitForBytesWritten(timeout):
+            return False
+        accepted = socket.waitForReadyRead(timeout) and socket.readLine().data().strip() == b"ok"
+        socket.disconnectFromServer()
+        return accepted
+
+    # A SERVER ACCEPTS CONNECTIONS ON "name" (EVEN IF TOO BUSY TO ANSWER "forward")
+    def isRunning(self, timeout = TIMEOUT):
+        socket = QLocalSocket()
+        socket.connectToServer(self.name)
+        running = socket.waitForConnected(timeout)
+        socket.abort()
+        return running
+
+    # FIRST LAUNCH: RECEIVE THE ARGUMENTS OF LATER LAUNCHES
+    # "listen" replaces a socket of the same name (even a live one with
+    # "UserAccessOption"), so nothing may accept a connection on it first:
+    # an instance too busy to answer "forward" keeps its server. The check
+    # and the listen hold a lock file, launches started at the same time
+    # cannot both pass it.
+    # ///////////////////////////////////////////////////////////////
+    def listen(self):
+        lock = QLockFile(os.path.join(QDir.tempPath(), f"{self.name}.lock"))
+        if not lock.tryLock(TIMEOUT):
+            log.warning("Single instance disabled: another launch is starting")
+            return False
+        try:
+            if self.isRunning():
+                log.warning("Single instance disabled: another instance is running but did not answer")
+                return False
+            # STALE SOCKET LEFT BY A CRASHED INSTANCE
+            QLocalServer.removeServer(self.name)
+            self.server = QLocalServer(self)
+            self.server.setSocketOptions(QLocalServer.UserAccessOption)
+            if not self.server.listen(self.name):
+                log.warning(f"Single instance disabled: {self.server.errorString()}")
+                self.close()
+                return False
+        finally:
+            lock.unlock()
+        self.server.newConnection.connect(self.newConnection)
+        return True
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+
+    def newConnection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(functools.partial(self.readMessage, socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def readMessage(self, socket):
+        if not socket.canReadLine():
+            return
+        try:
+            message = json.loads(socket.readLine().data().decode("utf-8"))
+            argv, cwd = [str(arg) for arg in message["argv"]], str(message["cwd"])
+        except (ValueError, KeyError, TypeError):
+            socket.abort()
+            return
+        socket.write(b"ok\n")
+        socket.flush()
+        self.messageReceived.emit(argv, cwd)
+
+# SHARED INSTANCE
+# ///////////////////////////////////////////////////////////////
+instance = SingleInstance()
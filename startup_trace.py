@@ -0,0 +1,235 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# STARTUP TRACE
+# Records startup phases (wall and CPU time) and the import time of every
+# module, and writes them as Chrome trace JSON (open it in chrome://tracing
+# or https://ui.perfetto.dev). Only uses the standard library, so it can be
+# imported before anything else.
+#
+# Usage: python main.py --trace-startup[=startup_trace.json] [--exit-after-startup]
+# ///////////////////////////////////////////////////////////////
+
+import contextlib
+import importlib.abc
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+FLAG = "--trace-startup"
+EXIT_FLAG = "--exit-after-startup"
+DEFAULT_FILE = "startup_trace.json"
+
+# SECONDS SINCE THE PROCESS STARTED (LINUX ONLY, "None" ELSEWHERE)
+# ///////////////////////////////////////////////////////////////
+def processAge():
+    try:
+        with open("/proc/self/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptime:
+            now = float(uptime.read().split()[0])
+        return now - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+# PEAK RESIDENT MEMORY IN MB ("None" WHERE UNAVAILABLE, E.G. WINDOWS)
+# ///////////////////////////////////////////////////////////////
+def peakMemory():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+# IMPORT TIMER
+# A meta path finder that asks the other finders for the spec and times
+# the loader's "exec_module", so nested imports show up nested.
+# ///////////////////////////////////////////////////////////////
+class TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, tracer):
+        self.loader = loader
+        self.tracer = tracer
+        self.start = None
+        self.cpu = None
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    # EXTENSION MODULES DO THEIR WORK IN "create_module", COUNT BOTH
+    def create_module(self, spec):
+        self.start = time.perf_counter()
+        self.cpu = time.thread_time()
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = self.start or time.perf_counter()
+        cpu = self.cpu or time.thread_time()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.tracer.add(module.__name__, "import", start - self.tracer.origin, time.perf_counter() - self.tracer.origin, time.thread_time() - cpu)
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def find_spec(self, name, path, target = None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = TimedLoader(spec.loader, self.tracer)
+                return spec
+        return None
+
+# TRACER
+# ///////////////////////////////////////////////////////////////
+class StartupTracer():
+    def __init__(self):
+        self.enabled = False
+        self.exitAfterStartup = False
+        self.path = DEFAULT_FILE
+        self.events = []
+        self.origin = time.perf_counter()
+        self.importTimer = None
+        self.done = False
+
+    # ENABLE FROM THE COMMAND LINE (FLAGS ARE REMOVED FROM "argv")
+    # ///////////////////////////////////////////////////////////////
+    def configure(self, argv):
+        for arg in list(argv[1:]):
+            if arg == FLAG or arg.startswith(FLAG + "="):
+                self.start(arg.partition("=")[2] or DEFAULT_FILE)
+                argv.remove(arg)
+            elif arg == EXIT_FLAG:
+                self.exitAfterStartup = True
+                argv.remove(arg)
+
+    def start(self, path = DEFAULT_FILE):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.path = path
+        self.origin = time.perf_counter()
+
+        # PYTHON STARTUP BEFORE THIS MODULE WAS IMPORTED
+        age = processAge()
+        if age is not None and age > 0:
+            self.add("interpreter", "startup", -age, 0.0, time.process_time())
+
+        self.importTimer = ImportTimer(self)
+        sys.meta_path.insert(0, self.importTimer)
+
+    def stop(self):
+        if self.importTimer in sys.meta_path:
+            sys.meta_path.remove(self.importTimer)
+        self.importTimer = None
+        self.enabled = False
+
+    # RECORD
+    # ///////////////////////////////////////////////////////////////
+    def add(self, name, category, start, end, cpu):
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"cpu_ms": round(cpu * 1000, 3)},
+        })
+
+    @contextlib.contextmanager
+    def phase(self, name, category = "phase"):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add(name, category, start - self.origin, time.perf_counter() - self.origin, time.thread_time() - cpu)
+
+    def mark(self, name):
+        if self.enabled:
+            now = time.perf_counter() - self.origin
+            self.events.append({"name": name, "cat": "mark", "ph": "i", "s": "p", "ts": now * 1e6, "pid": os.getpid(), "tid": threading.get_ident()})
+
+    # FIRST PAINT OF A WINDOW ENDS THE TRACE
+    # ///////////////////////////////////////////////////////////////
+    def watchFirstPaint(self, window):
+        if not self.enabled or self.done:
+            return
+        from PySide6.QtCore import QEvent, QObject, QTimer
+        from PySide6.QtWidgets import QApplication
+
+        tracer = self
+        class FirstPaint(QObject):
+            def eventFilter(self, obj, event):
+                if obj is window and event.type() in (QEvent.UpdateRequest, QEvent.Paint):
+                    window.removeEventFilter(self)
+                    with tracer.phase("first paint"):
+                        obj.event(event)
+                    tracer.finish()
+                    if tracer.exitAfterStartup:
+                        QTimer.singleShot(0, QApplication.instance().quit)
+                    return True
+                return False
+
+        self.firstPaint = FirstPaint(window)
+        window.installEventFilter(self.firstPaint)
+
+    # WRITE CHROME TRACE JSON
+    # ///////////////////////////////////////////////////////////////
+    def finish(self):
+        if not self.enabled or self.done:
+            return
+        self.done = True
+        self.stop()
+        self.mark("startup done")
+        total = time.perf_counter() - self.origin
+        trace = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "PyDracula"}},
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": threading.get_ident(), "args": {"name": "GUI thread"}},
+            ] + sorted(self.events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"startup_ms": round(total * 1000, 3), "max_rss_mb": peakMemory(), "modules": len(sys.modules), "argv": sys.argv},
+        }
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(trace, file)
+        log.info(f"Startup trace: {total * 1000:.1f} ms to first paint, written to {self.path}")
+        for event in self.slowest("import", 5):
+            log.info(f"    import {event['name']}: {event['dur'] / 1000:.1f} ms")
+
+    # SLOWEST ENTRIES (E.G. FOR A SUMMARY)
+    def slowest(self, category = None, count = 10):
+        events = [event for event in self.events if event.get("ph") == "X" and category in (None, event["cat"])]
+        return sorted(events, key=lambda event: event["dur"], reverse=True)[:count]
+
+# SHARED TRACER
+# ///////////////////////////////////////////////////////////////
+tracer = StartupTracer()
@@ -0,0 +1,105 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+# SESSION RESTORE WITH MALFORMED SETTINGS
+# A hand-edited, corrupt or older settings file must not stop the window
+# from opening: invalid fields are skipped and keep their defaults.
+# Usage: python -m pytest tests
+# ///////////////////////////////////////////////////////////////
+
+import json
+import os
+import runpy
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# HEADLESS
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+MALFORMED = [
+    "not a dict",
+    ["btn_widgets"],
+    {"geometry": 42, "menu": "yes", "leftBox": 1, "rightBox": [], "maximized": "true", "page": ["btn_widgets"]},
+    {"geometry": "géômétrie", "page": {"name": "btn_widgets"}},
+    {"geometry": "!!! not base64 !!!", "page": "btn_missing"},
+    {"menu": None, "leftBox": {"width": 240}, "page": 3},
+]
+
+# "main.py" WITHOUT ITS "__main__" BLOCK (THE SETTINGS FILE IS NEVER LOADED OR WRITTEN)
+@pytest.fixture(scope="module")
+def env():
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    env = runpy.run_path(os.path.join(ROOT, "main.py"), run_name="test")
+    env["Settings"].PREBUILD_PAGES = False
+    env["app"] = app
+    yield env
+    env["settingsStore"].values.pop("SESSION", None)
+
+def openWindow(env, session):
+    env["settingsStore"].values["SESSION"] = session
+    window = env["MainWindow"]()
+    env["app"].processEvents()
+    return window
+
+def closeWindow(env, window):
+    window.close()
+    window.deleteLater()
+    env["app"].processEvents()
+
+@pytest.mark.parametrize("session", MALFORMED)
+def test_malformed_session_keeps_defaults(env, session):
+    window = openWindow(env, session)
+    try:
+        ui = window.ui
+        assert ui.leftMenuBg.minimumWidth() == 60
+        assert ui.extraLeftBox.minimumWidth() == 0
+        assert ui.extraRightBox.minimumWidth() == 0
+        assert not ui.toggleLeftBox.property("active")
+        assert ui.stackedWidget.currentWidget() is ui.home
+    finally:
+        closeWindow(env, window)
+
+def test_valid_fields_are_restored_next_to_invalid_ones(env):
+    window = openWindow(env, {"geometry": 42, "menu": True, "leftBox": "yes", "page": "btn_widgets"})
+    try:
+        assert window.ui.leftMenuBg.minimumWidth() == env["Settings"].MENU_WIDTH
+        assert window.ui.extraLeftBox.minimumWidth() == 0
+        assert window.ui.stackedWidget.currentWidget() is window.ui.widgets
+    finally:
+        closeWindow(env, window)
+
+def test_settings_of_the_wrong_type_are_ignored(env, tmp_path):
+    class Defaults():
+        MENU_WIDTH = 240
+        TIME_ANIMATION = 500
+        PERF_LOG_FILE = None
+        SCALE = 1.0
+
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"MENU_WIDTH": "wide", "TIME_ANIMATION": 300, "PERF_LOG_FILE": "perf.jsonl", "SCALE": 2}), encoding="utf-8")
+    store = env["SettingsStore"](str(path))
+    store.bind(Defaults)
+    store.load()
+    assert Defaults.MENU_WIDTH == 240
+    assert Defaults.TIME_ANIMATION == 300
+    assert Defaults.PERF_LOG_FILE == "perf.jsonl"
+    assert Defaults.SCALE == 2
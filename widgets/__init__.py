@@ -15,3 +15,6 @@
 # ///////////////////////////////////////////////////////////////
 
 from . custom_grips import CustomGrip
+from . shadow_frame import ShadowFrame
+from . panel_transition import PanelTransition
+from . perf_hud import PerfHud
@@ -14,18 +14,65 @@
 #
 # ///////////////////////////////////////////////////////////////
 
-from PySide6.QtCore import *
-from PySide6.QtGui import *
-from PySide6.QtWidgets import *
+from PySide6.QtCore import QObject, QRect, QSize, Qt, QTimer
+from PySide6.QtGui import QCursor
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QRubberBand, QSizeGrip, QWidget
+
+# RESIZE ENGINE
+# Grips only request a geometry, it's applied at most once per display
+# frame. With "outline" the window keeps its size during the drag, a
+# rubber band shows the new geometry and the layout runs once on release.
+# ///////////////////////////////////////////////////////////////
+class ResizeEngine(QObject):
+    def __init__(self, window, outline = False):
+        QObject.__init__(self, window)
+        self.window = window
+        self.pending = None
+        self.rubberBand = QRubberBand(QRubberBand.Rectangle) if outline else None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.flush)
+
+    def frameInterval(self):
+        screen = self.window.screen()
+        rate = screen.refreshRate() if screen else 0
+        return max(1, int(1000 / rate)) if rate > 0 else 16
+
+    # REQUEST GEOMETRY
+    def setGeometry(self, geometry):
+        self.pending = QRect(geometry)
+        if self.rubberBand:
+            self.rubberBand.setGeometry(self.pending)
+            self.rubberBand.show()
+        elif not self.timer.isActive():
+            self.timer.start(self.frameInterval())
+
+    # APPLY PENDING GEOMETRY (ONE PER FRAME)
+    def flush(self):
+        if self.pending is not None and not self.rubberBand:
+            self.window.setGeometry(self.pending)
+            self.pending = None
+
+    # END OF DRAG
+    def commit(self):
+        self.timer.stop()
+        if self.rubberBand:
+            self.rubberBand.hide()
+        if self.pending is not None:
+            self.window.setGeometry(self.pending)
+            self.pending = None
 
 class CustomGrip(QWidget):
-    def __init__(self, parent, position, disable_color = False):
+    def __init__(self, parent, position, disable_color = False, outline = False):
 
         # SETUP UI
         QWidget.__init__(self)
         self.parent = parent
         self.setParent(parent)
         self.wi = Widgets()
+        self.engine = ResizeEngine(parent, outline)
 
         # SHOW TOP GRIP
         if position == Qt.TopEdge:
@@ -43,7 +90,7 @@ class CustomGrip(QWidget):
                 height = max(self.parent.minimumHeight(), self.parent.height() - delta.y())
                 geo = self.parent.geometry()
                 geo.setTop(geo.bottom() - height)
-                self.parent.setGeometry(geo)
+                self.engine.setGeometry(geo)
                 event.accept()
             self.wi.top.mouseMoveEvent = resize_top
 
@@ -67,7 +114,9 @@ class CustomGrip(QWidget):
             def resize_bottom(event):
                 delta = event.pos()
                 height = max(self.parent.minimumHeight(), self.parent.height() + delta.y())
-                self.parent.resize(self.parent.width(), height)
+                geo = self.parent.geometry()
+                geo.setHeight(height)
+                self.engine.setGeometry(geo)
                 event.accept()
             self.wi.bottom.mouseMoveEvent = resize_bottom
 
@@ -89,7 +138,7 @@ class CustomGrip(QWidget):
                 width = max(self.parent.minimumWidth(), self.parent.width() - delta.x())
                 geo = self.parent.geometry()
                 geo.setLeft(geo.right() - width)
-                self.parent.setGeometry(geo)
+                self.engine.setGeometry(geo)
                 event.accept()
             self.wi.leftgrip.mouseMoveEvent = resize_left
 
@@ -106,7 +155,9 @@ class CustomGrip(QWidget):
             def resize_right(event):
                 delta = event.pos()
                 width = max(self.parent.minimumWidth(), self.parent.width() + delta.x())
-                self.parent.resize(width, self.parent.height())
+                geo = self.parent.geometry()
+                geo.setWidth(width)
+                self.engine.setGeometry(geo)
                 event.accept()
             self.wi.rightgrip.mouseMoveEvent = resize_right
 
@@ -117,6 +168,7 @@ class CustomGrip(QWidget):
 
     def mouseReleaseEvent(self, event):
         self.mousePos = None
+        self.engine.commit()
 
     def resizeEvent(self, event):
         if hasattr(self.wi, 'container_top'):
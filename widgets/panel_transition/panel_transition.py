@@ -0,0 +1,177 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+from PySide6.QtCore import QEasingCurve, QEvent, QPoint, QRect, QRectF, Qt, QVariantAnimation
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QApplication, QWidget
+
+# SNAPSHOT PANEL ANIMATION
+# Animating "minimumWidth" runs a layout pass over the whole content on
+# every tick. Here the final widths are committed to the layout once,
+# "root" is grabbed before and after, and an overlay draws the frames
+# from the two pixmaps. In each row where a panel changes width, every
+# widget rect is interpolated between its start and end rect:
+# - panels show their open (wider) snapshot, clipped to the current rect
+# - neighbours show their end snapshot sliding with the panel edge; when
+#   the end snapshot is narrower, their far edge column fills the rest
+# Rows where no panel changes are part of their ancestors' snapshots.
+# ///////////////////////////////////////////////////////////////
+class PanelTransition(QWidget):
+    def __init__(self, root, panels, duration = 500, easing = QEasingCurve.InOutQuart):
+        QWidget.__init__(self, root.parentWidget())
+        self.root = root
+        # {PANEL WIDGET: END WIDTH}
+        self.panels = panels
+        self.start = None
+        self.end = None
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.hide()
+
+        # PROGRESS 0 -> 1
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(0.0)
+        self.animation.setEndValue(1.0)
+        self.animation.setDuration(duration)
+        self.animation.setEasingCurve(easing)
+        self.animation.valueChanged.connect(self.update)
+        self.animation.finished.connect(self.finish)
+
+        # ROWS (LAYOUTS OF THE PANELS PARENTS), OUTER FIRST
+        self.rows = []
+        for panel in panels:
+            row = panel.parentWidget()
+            if row not in self.rows:
+                self.rows.append(row)
+        self.rows.sort(key=self.depth)
+
+    def depth(self, widget):
+        depth = 0
+        while widget is not None and widget is not self.root:
+            widget = widget.parentWidget()
+            depth += 1
+        return depth
+
+    # WIDGETS OF A ROW, IN LAYOUT ORDER
+    def segments(self, row):
+        layout = row.layout()
+        items = [layout.itemAt(i).widget() for i in range(layout.count())] if layout else []
+        return [w for w in items if w is not None and not w.isHidden()]
+
+    # GRAB ROOT AND RECTS OF EVERY SEGMENT
+    def snapshot(self):
+        rects = {}
+        for row in self.rows:
+            for widget in self.segments(row):
+                rects[widget] = QRect(widget.mapTo(self.root, QPoint(0, 0)), widget.size())
+        return self.root.grab(), rects
+
+    # START
+    # ///////////////////////////////////////////////////////////////
+    def run(self):
+        self.start = self.snapshot()
+
+        # COMMIT FINAL WIDTHS, ONE LAYOUT PASS
+        for panel, width in self.panels.items():
+            panel.setMinimumWidth(width)
+        QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        self.end = self.snapshot()
+
+        self.setGeometry(self.root.geometry())
+        self.root.installEventFilter(self)
+        self.raise_()
+        self.show()
+        self.animation.start()
+
+    # STOP AND SHOW THE REAL WIDGETS
+    def finish(self):
+        self.animation.stop()
+        self.root.removeEventFilter(self)
+        self.hide()
+        self.start = self.end = None
+        self.deleteLater()
+
+    def isRunning(self):
+        return self.end is not None
+
+    # THE SNAPSHOTS ONLY MATCH THE SIZE THEY WERE TAKEN AT: WHEN "root"
+    # MOVES OR IS RESIZED, FOLLOW IT AND SHOW THE REAL (FINAL) LAYOUT
+    def eventFilter(self, watched, event):
+        if watched is self.root and event.type() in (QEvent.Resize, QEvent.Move) and self.isRunning():
+            self.setGeometry(self.root.geometry())
+            self.finish()
+        return False
+
+    # DRAW HELPERS
+    # ///////////////////////////////////////////////////////////////
+    def drawPart(self, painter, target, pixmap, source):
+        dpr = pixmap.devicePixelRatio()
+        painter.drawPixmap(target, pixmap, QRectF(source.x() * dpr, source.y() * dpr, source.width() * dpr, source.height() * dpr))
+
+    # "part" (PIXMAP, SOURCE RECT) AT ONE EDGE OF "rect", CLIPPED TO IT
+    def drawAnchored(self, painter, rect, part, anchorLeft):
+        pixmap, source = part
+        x = rect.x() if anchorLeft else rect.x() + rect.width() - source.width()
+        painter.save()
+        painter.setClipRect(rect, Qt.IntersectClip)
+        self.drawPart(painter, QRectF(x, rect.y(), source.width(), rect.height()), pixmap, source)
+
+        # NARROWER THAN "rect": STRETCH THE FAR EDGE COLUMN
+        gap = rect.width() - source.width()
+        if gap > 0:
+            edge = source.x() + source.width() - 1 if anchorLeft else source.x()
+            target = QRectF(x + source.width() if anchorLeft else rect.x(), rect.y(), gap, rect.height())
+            self.drawPart(painter, target, pixmap, QRectF(edge, source.y(), 1, source.height()))
+        painter.restore()
+
+    # FRAME
+    # ///////////////////////////////////////////////////////////////
+    def paintEvent(self, event):
+        if not self.end:
+            return
+        progress = self.animation.currentValue() or 0.0
+        startPixmap, startRects = self.start
+        endPixmap, endRects = self.end
+
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, endPixmap)
+
+        for row in self.rows:
+            segments = [w for w in self.segments(row) if w in startRects and w in endRects]
+            changing = [i for i, w in enumerate(segments) if w in self.panels and startRects[w].width() != endRects[w].width()]
+            if not changing:
+                continue
+            for index, widget in enumerate(segments):
+                a, b = QRectF(startRects[widget]), QRectF(endRects[widget])
+                rect = QRectF(
+                    a.x() + (b.x() - a.x()) * progress,
+                    a.y() + (b.y() - a.y()) * progress,
+                    a.width() + (b.width() - a.width()) * progress,
+                    a.height() + (b.height() - a.height()) * progress,
+                )
+                if rect.width() <= 0 or rect.height() <= 0:
+                    continue
+                if index in changing:
+                    # PANEL: OPEN SNAPSHOT, LEFT PART SHOWN (AS LAID OUT AT THAT WIDTH)
+                    part = (startPixmap, a) if a.width() > b.width() else (endPixmap, b)
+                    anchorLeft = True
+                else:
+                    # NEIGHBOUR: END SNAPSHOT, FOLLOWS THE EDGE OF THE PANEL BEFORE IT (OR AFTER)
+                    part = (endPixmap, b)
+                    anchorLeft = changing[0] < index
+                self.drawAnchored(painter, rect, part, anchorLeft)
+        painter.end()
@@ -0,0 +1,114 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+from PySide6.QtCore import QEvent, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QWidget
+
+# PERFORMANCE HUD
+# Overlay in the bottom right corner of "parent" showing the last
+# PerfMonitor summary: event loop lag, frame time and their histograms.
+# Transparent for the mouse, so it never gets in the way.
+# ///////////////////////////////////////////////////////////////
+class PerfHud(QWidget):
+    def __init__(self, parent, monitor, margin = 10, bottomMargin = 32):
+        QWidget.__init__(self, parent)
+        self.setObjectName("perfHud")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.monitor = monitor
+        self.margin = margin
+        self.bottomMargin = bottomMargin
+        self.snapshot = None
+        self.font = QFont("Segoe UI", 8)
+        self.resize(250, 170)
+        self.hide()
+
+        monitor.updated.connect(self.setSnapshot)
+        parent.installEventFilter(self)
+
+    # SHOW / HIDE (THE MONITOR ONLY RUNS WHILE VISIBLE)
+    # ///////////////////////////////////////////////////////////////
+    def setActive(self, active):
+        if active == self.isVisible():
+            return
+        if active:
+            self.monitor.startReports()
+            self.reposition()
+            self.show()
+            self.raise_()
+        else:
+            self.monitor.stopReports()
+            self.hide()
+
+    def setSnapshot(self, snapshot):
+        self.snapshot = snapshot
+        self.update()
+
+    # FOLLOW THE PARENT SIZE
+    # ///////////////////////////////////////////////////////////////
+    def reposition(self):
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.margin, parent.height() - self.height() - self.bottomMargin)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.reposition()
+        return False
+
+    # PAINT
+    # ///////////////////////////////////////////////////////////////
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(33, 37, 43, 220))
+        painter.drawRoundedRect(QRectF(self.rect()), 8, 8)
+
+        painter.setFont(self.font)
+        painter.setPen(QColor(221, 221, 221))
+        if not self.snapshot:
+            painter.drawText(self.rect(), Qt.AlignCenter, "Measuring...")
+            return
+
+        lag = self.snapshot["lag_ms"]
+        frame = self.snapshot["frame_ms"]
+        lines = (
+            f"Event loop lag  {lag['median']:.1f} / {lag['p95']:.1f} / {lag['max']:.1f} ms",
+            f"Frame time  {frame['median']:.1f} / {frame['p95']:.1f} / {frame['max']:.1f} ms",
+            f"Frames/s  {self.snapshot['fps']}   (median / p95 / max)",
+        )
+        y = 8
+        for line in lines:
+            painter.drawText(10, y, self.width() - 20, 14, Qt.AlignLeft | Qt.AlignVCenter, line)
+            y += 15
+
+        # HISTOGRAMS (LAG IN PURPLE, FRAMES IN PINK)
+        labels = self.snapshot["buckets"]
+        top = y + 6
+        height = self.height() - top - 20
+        width = (self.width() - 20) / len(labels)
+        for counts, color, offset in ((lag["histogram"], QColor(189, 147, 249), 0.1), (frame["histogram"], QColor(255, 121, 198), 0.5)):
+            total = max(1, sum(counts))
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            for index, count in enumerate(counts):
+                barHeight = height * count / total
+                painter.drawRect(QRectF(10 + width * (index + offset), top + height - barHeight, width * 0.4, barHeight))
+
+        painter.setPen(QColor(150, 150, 150))
+        for index, label in enumerate(labels):
+            painter.drawText(QRectF(10 + width * index, top + height + 2, width, 14), Qt.AlignCenter, label)
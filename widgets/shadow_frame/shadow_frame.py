@@ -0,0 +1,126 @@
+# ///////////////////////////////////////////////////////////////
+#
+# BY: WANDERSON M.PIMENTA
+# PROJECT MADE WITH: Qt Designer and PySide6
+# V: 1.0.0
+#
+# This project can be used freely for all uses, as long as they maintain the
+# respective credits only in the Python scripts, any information in the visual
+# interface (GUI) can be modified without any implication.
+#
+# There are limitations on Qt licenses if you want to use your products
+# commercially, I recommend reading them on the official website:
+# https://doc.qt.io/qtforpython/licenses.html
+#
+# ///////////////////////////////////////////////////////////////
+
+from PySide6.QtCore import QEvent, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsDropShadowEffect, QGraphicsRectItem, QGraphicsScene, QWidget
+
+# CACHED DROP SHADOW
+# Paints the shadow of "content" from a 9-slice pixmap instead of a
+# QGraphicsDropShadowEffect, so the content is never rendered through
+# an offscreen buffer and repaints inside it don't blur anything.
+# ///////////////////////////////////////////////////////////////
+class ShadowFrame(QWidget):
+    # (BLUR RADIUS, RGBA, X OFFSET, Y OFFSET, DEVICE PIXEL RATIO) -> (PIXMAP, MARGIN)
+    cache = {}
+
+    def __init__(self, parent, content, blurRadius = 17, color = QColor(0, 0, 0, 150), offset = (0, 0)):
+        QWidget.__init__(self, parent)
+        self.content = content
+        self.blurRadius = blurRadius
+        self.color = QColor(color)
+        self.offset = offset
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+
+        # FOLLOW CONTENT AND PARENT GEOMETRY
+        parent.installEventFilter(self)
+        content.installEventFilter(self)
+        self.setGeometry(parent.rect())
+        self.lower()
+
+    # SET SHADOW (E.G. ON THEME CHANGE)
+    # ///////////////////////////////////////////////////////////////
+    def setShadow(self, blurRadius, color, offset = (0, 0)):
+        self.blurRadius = blurRadius
+        self.color = QColor(color)
+        self.offset = offset
+        self.update()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Resize, QEvent.Move):
+            if obj is self.parent():
+                self.setGeometry(self.parent().rect())
+            self.update()
+        return False
+
+    # RENDER 9-SLICE SOURCE
+    # A square of "2 * margin + 1" px with the same shadow Qt's effect would
+    # draw, the square itself cleared so only the shadow is left.
+    # ///////////////////////////////////////////////////////////////
+    def shadowPixmap(self):
+        dpr = self.devicePixelRatioF()
+        key = (self.blurRadius, self.color.rgba(), self.offset[0], self.offset[1], dpr)
+        if key in ShadowFrame.cache:
+            return ShadowFrame.cache[key]
+
+        margin = int(self.blurRadius + max(abs(self.offset[0]), abs(self.offset[1]))) + 1
+        side = 2 * margin + 1
+        size = side + 2 * margin
+
+        item = QGraphicsRectItem(0, 0, side, side)
+        item.setBrush(QColor(0, 0, 0))
+        item.setPen(Qt.NoPen)
+        effect = QGraphicsDropShadowEffect()
+        effect.setBlurRadius(self.blurRadius)
+        effect.setColor(self.color)
+        effect.setOffset(*self.offset)
+        item.setGraphicsEffect(effect)
+        scene = QGraphicsScene()
+        scene.addItem(item)
+
+        image = QImage(round(size * dpr), round(size * dpr), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        scene.render(painter, QRectF(0, 0, size, size), QRectF(-margin, -margin, size, size))
+        painter.setCompositionMode(QPainter.CompositionMode_Clear)
+        painter.fillRect(QRectF(margin, margin, side, side), Qt.transparent)
+        painter.end()
+
+        ShadowFrame.cache[key] = (QPixmap.fromImage(image), margin)
+        return ShadowFrame.cache[key]
+
+    # PAINT SLICES AROUND THE CONTENT
+    # ///////////////////////////////////////////////////////////////
+    def paintEvent(self, event):
+        pixmap, m = self.shadowPixmap()
+        dpr = pixmap.devicePixelRatio()
+        c = 2 * m # CORNER SIZE (OUTSIDE + INSIDE)
+        r = self.content.geometry().adjusted(-m, -m, m, m)
+        if r.width() <= 2 * c or r.height() <= 2 * c:
+            return
+        w = r.width() - 2 * c
+        h = r.height() - 2 * c
+
+        # TARGET RECT, SOURCE RECT (LOGICAL PX)
+        slices = (
+            (QRect(r.left(), r.top(), c, c), QRect(0, 0, c, c)),
+            (QRect(r.left() + c, r.top(), w, c), QRect(c, 0, 1, c)),
+            (QRect(r.right() - c + 1, r.top(), c, c), QRect(c + 1, 0, c, c)),
+            (QRect(r.left(), r.top() + c, c, h), QRect(0, c, c, 1)),
+            (QRect(r.right() - c + 1, r.top() + c, c, h), QRect(c + 1, c, c, 1)),
+            (QRect(r.left(), r.bottom() - c + 1, c, c), QRect(0, c + 1, c, c)),
+            (QRect(r.left() + c, r.bottom() - c + 1, w, c), QRect(c, c + 1, 1, c)),
+            (QRect(r.right() - c + 1, r.bottom() - c + 1, c, c), QRect(c + 1, c + 1, c, c)),
+        )
+
+        painter = QPainter(self)
+        clip = event.rect()
+        for target, source in slices:
+            if target.intersects(clip):
+                painter.drawPixmap(QRectF(target), pixmap, QRectF(source.x() * dpr, source.y() * dpr, source.width() * dpr, source.height() * dpr))
+        painter.end()